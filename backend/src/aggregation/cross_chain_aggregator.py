@@ -11,19 +11,25 @@ Solution: Use TCS to quantify confidence in cross-chain aggregations.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Set
-from datetime import datetime, timedelta
-from collections import defaultdict
+from typing import Any, List, Dict, Optional, Set, Callable, Tuple
+from datetime import datetime, timezone
 import logging
-
-from src.common.schema import RiskEvent, AggregatedRiskSnapshot, WindowState
+import time
+
+from src.common.schema import (
+    RiskEvent,
+    AggregatedRiskSnapshot,
+    WindowState,
+    FinalityTier,
+    FINALITY_TIER_CONFIDENCE
+)
 from src.common.config import config
 from src.confidence.tcs_calculator import tcs_calculator
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChainEventBatch:
     """Batch of events from a single chain."""
     chain: str
@@ -54,6 +60,12 @@ class CrossChainAggregator:
             "solana": config.CHAINS["solana"].tier3_time_sec
         }
 
+        # (slowest chain, finality time) per chain tuple (see _slowest_finality)
+        self._slowest_finality_cache: Dict[Tuple[str, ...], Tuple[str, int]] = {}
+
+        # Per-coin depeg checks, built on first use (see _compile_depeg_check)
+        self._depeg_checks: Dict[str, Optional[Callable[[AggregatedRiskSnapshot], None]]] = {}
+
     def aggregate_cross_chain(
         self,
         events_by_chain: Dict[str, List[RiskEvent]],
@@ -93,12 +105,7 @@ class CrossChainAggregator:
         adjusted_tcs = tcs_breakdown.temporal_confidence * chain_confidence
 
         # Aggregate metrics across chains
-        prices = [e.price for e in all_events if e.price is not None]
-        liquidities = [e.liquidity_depth for e in all_events if e.liquidity_depth is not None]
-        volumes = [e.volume for e in all_events if e.volume is not None]
-        supply_changes = [e.net_supply_change for e in all_events if e.net_supply_change is not None]
-        volatilities = [e.market_volatility for e in all_events if e.market_volatility is not None]
-        sentiments = [e.sentiment_score for e in all_events if e.sentiment_score is not None]
+        metrics = self._aggregate_metrics(all_events)
 
         # Create cross-chain snapshot
         snapshot = AggregatedRiskSnapshot(
@@ -107,14 +114,7 @@ class CrossChainAggregator:
             chains=list(events_by_chain.keys()),
             window_id=window_id,
             window_state=WindowState.PROVISIONAL.value,  # Wait for all chains to finalize
-            avg_price=sum(prices) / len(prices) if prices else None,
-            min_price=min(prices) if prices else None,
-            max_price=max(prices) if prices else None,
-            total_liquidity=sum(liquidities) if liquidities else None,
-            total_volume=sum(volumes) if volumes else None,
-            net_supply_change=sum(supply_changes) if supply_changes else None,
-            market_volatility=max(volatilities) if volatilities else None,
-            sentiment_score=sum(sentiments) / len(sentiments) if sentiments else None,
+            **metrics,
             temporal_confidence=adjusted_tcs,
             confidence_breakdown={
                 "finality_weight": tcs_breakdown.finality_weight,
@@ -123,27 +123,116 @@ class CrossChainAggregator:
                 "staleness_penalty": tcs_breakdown.staleness_penalty,
                 "adjusted_tcs": adjusted_tcs
             },
-            num_events_aggregated=len(all_events),
-            sources_included=list(set(e.source for e in all_events)),
-            event_ids=[e.event_id for e in all_events]
+            num_events_aggregated=len(all_events)
         )
 
         # Check depeg (price should be same across chains)
         if snapshot.avg_price:
-            depeg_distance = abs(snapshot.avg_price - 1.0)
-            coin_config = config.COINS.get(coin)
-            if coin_config:
-                snapshot.is_depegged = depeg_distance >= coin_config.depeg_threshold
-                snapshot.depeg_severity = depeg_distance
+            try:
+                depeg_check = self._depeg_checks[coin]
+            except KeyError:
+                depeg_check = self._depeg_checks[coin] = self._compile_depeg_check(coin)
+            if depeg_check is not None:
+                depeg_check(snapshot)
 
         logger.info(
-            f"Cross-chain aggregation: {coin} across {len(events_by_chain)} chains, "
-            f"TCS={adjusted_tcs:.3f} (chain_conf={chain_confidence:.3f}), "
-            f"events={len(all_events)}"
+            "Cross-chain aggregation: %s across %d chains, "
+            "TCS=%.3f (chain_conf=%.3f), events=%d",
+            coin, len(events_by_chain), adjusted_tcs, chain_confidence, len(all_events)
         )
 
         return snapshot
 
+    def _compile_depeg_check(
+        self,
+        coin: str
+    ) -> Optional[Callable[[AggregatedRiskSnapshot], None]]:
+        """
+        Build a depeg check with the coin's threshold bound in.
+
+        Returns None for coins without a config, which skip the check.
+        """
+        coin_config = config.COINS.get(coin)
+        if coin_config is None:
+            return None
+
+        depeg_threshold = coin_config.depeg_threshold
+
+        def check(snapshot: AggregatedRiskSnapshot) -> None:
+            depeg_distance = abs(snapshot.avg_price - 1.0)
+            snapshot.is_depegged = depeg_distance >= depeg_threshold
+            snapshot.depeg_severity = depeg_distance
+
+        return check
+
+    def _aggregate_metrics(self, events: List[RiskEvent]) -> Dict[str, Any]:
+        """
+        Reduce event metrics into snapshot fields in a single pass.
+
+        Each metric ignores events where it is None; a metric with no
+        values at all aggregates to None. Event sources and IDs are
+        collected in the same pass. Transposing the events into
+        per-field columns first was measured slower than this loop, since
+        each column still needs its own None filter.
+        """
+        price_sum = 0.0
+        price_count = 0
+        min_price = None
+        max_price = None
+        total_liquidity = None
+        total_volume = None
+        net_supply_change = None
+        market_volatility = None
+        sentiment_sum = 0.0
+        sentiment_count = 0
+        sources: Set[str] = set()
+        event_ids: List[str] = []
+
+        for e in events:
+            sources.add(e.source)
+            event_ids.append(e.event_id)
+
+            price = e.price
+            if price is not None:
+                price_sum += price
+                price_count += 1
+                if min_price is None or price < min_price:
+                    min_price = price
+                if max_price is None or price > max_price:
+                    max_price = price
+
+            if e.liquidity_depth is not None:
+                total_liquidity = (total_liquidity or 0.0) + e.liquidity_depth
+
+            if e.volume is not None:
+                total_volume = (total_volume or 0.0) + e.volume
+
+            if e.net_supply_change is not None:
+                net_supply_change = (net_supply_change or 0.0) + e.net_supply_change
+
+            volatility = e.market_volatility
+            if volatility is not None and (
+                market_volatility is None or volatility > market_volatility
+            ):
+                market_volatility = volatility
+
+            if e.sentiment_score is not None:
+                sentiment_sum += e.sentiment_score
+                sentiment_count += 1
+
+        return {
+            "avg_price": price_sum / price_count if price_count else None,
+            "min_price": min_price,
+            "max_price": max_price,
+            "total_liquidity": total_liquidity,
+            "total_volume": total_volume,
+            "net_supply_change": net_supply_change,
+            "market_volatility": market_volatility,
+            "sentiment_score": sentiment_sum / sentiment_count if sentiment_count else None,
+            "sources_included": list(sources),
+            "event_ids": event_ids
+        }
+
     def _calculate_chain_confidence(
         self,
         events_by_chain: Dict[str, List[RiskEvent]]
@@ -160,15 +249,18 @@ class CrossChainAggregator:
             if not events:
                 continue
 
-            # Get minimum finality confidence for this chain
+            # Get minimum finality confidence for this chain. A chain only
+            # has a handful of distinct tiers, so map those rather than
+            # resolving the confidence value once per event.
+            tiers = {e.finality_tier for e in events}
             min_confidence = min(
-                e.get_confidence_tier_value() for e in events
+                FINALITY_TIER_CONFIDENCE.get(tier, 0.0) for tier in tiers
             )
             chain_confidences.append(min_confidence)
 
             logger.debug(
-                f"Chain {chain}: min_confidence={min_confidence:.3f} "
-                f"from {len(events)} events"
+                "Chain %s: min_confidence=%.3f from %d events",
+                chain, min_confidence, len(events)
             )
 
         # Cross-chain confidence = minimum across all chains
@@ -178,8 +270,8 @@ class CrossChainAggregator:
         overall_confidence = min(chain_confidences)
 
         logger.info(
-            f"Cross-chain confidence: {overall_confidence:.3f} "
-            f"(weakest of {len(chain_confidences)} chains)"
+            "Cross-chain confidence: %.3f (weakest of %d chains)",
+            overall_confidence, len(chain_confidences)
         )
 
         return overall_confidence
@@ -196,30 +288,23 @@ class CrossChainAggregator:
         1. Grace period has passed for all chains
         2. All chains have reached minimum finality threshold
         """
-        current_time = datetime.utcnow()
-
-        # Check if grace period has passed
-        grace_period_elapsed = current_time >= window_end + timedelta(
-            seconds=self.grace_period_sec
+        # Check if grace period has passed (window_end is naive UTC)
+        grace_period_end = (
+            window_end.replace(tzinfo=timezone.utc).timestamp() + self.grace_period_sec
         )
+        grace_period_elapsed = time.time() >= grace_period_end
 
         if not grace_period_elapsed:
             logger.debug("Grace period not yet elapsed for cross-chain aggregation")
             return False
 
-        # Check minimum finality per chain
+        # Check minimum finality per chain. Require at least tier2 (0.8
+        # confidence): stop at the first tier1 event instead of scanning
+        # every event for the minimum tier.
+        tier1 = FinalityTier.TIER1.value
         for chain, events in events_by_chain.items():
-            if not events:
-                continue
-
-            # Get minimum finality tier for this chain
-            min_tier = min(e.finality_tier for e in events)
-
-            # Require at least tier2 (0.8 confidence) for cross-chain aggregation
-            if min_tier == "tier1":
-                logger.debug(
-                    f"Chain {chain} not ready: still has tier1 events"
-                )
+            if any(e.finality_tier == tier1 for e in events):
+                logger.debug("Chain %s not ready: still has tier1 events", chain)
                 return False
 
         logger.info("Cross-chain aggregation ready: all chains ≥tier2")
@@ -250,21 +335,35 @@ class CrossChainAggregator:
         # Get average price per chain
         chain_prices = {}
         for chain, events in events_by_chain.items():
-            prices = [e.price for e in events if e.price is not None]
-            if prices:
-                chain_prices[chain] = sum(prices) / len(prices)
+            price_sum = 0.0
+            price_count = 0
+            for e in events:
+                if e.price is not None:
+                    price_sum += e.price
+                    price_count += 1
+            if price_count:
+                chain_prices[chain] = price_sum / price_count
 
         if len(chain_prices) < 2:
             return {"divergence_detected": False}
 
-        # Check all pairs for divergence
-        chains = list(chain_prices.keys())
         divergences = []
 
-        for i, chain1 in enumerate(chains):
-            for chain2 in chains[i+1:]:
-                price1 = chain_prices[chain1]
-                price2 = chain_prices[chain2]
+        # No pair can diverge by more than the overall spread, so skip the
+        # pairwise scan in the common case where chains agree
+        if max(chain_prices.values()) - min(chain_prices.values()) <= threshold:
+            return {
+                "divergence_detected": False,
+                "divergence_count": 0,
+                "divergences": divergences,
+                "chain_prices": chain_prices
+            }
+
+        # Check all pairs for divergence
+        priced_chains = list(chain_prices.items())
+
+        for i, (chain1, price1) in enumerate(priced_chains):
+            for chain2, price2 in priced_chains[i+1:]:
                 diff = abs(price1 - price2)
 
                 if diff > threshold:
@@ -295,11 +394,7 @@ class CrossChainAggregator:
         chains: List[str]
     ) -> str:
         """Get the chain with the slowest finality time."""
-        slowest_chain = max(
-            chains,
-            key=lambda c: self.chain_finality_times.get(c, 0)
-        )
-        return slowest_chain
+        return self._slowest_finality(chains)[0]
 
     def calculate_cross_chain_grace_period(
         self,
@@ -310,10 +405,23 @@ class CrossChainAggregator:
 
         Grace period = finality time of slowest chain
         """
-        max_finality = max(
-            self.chain_finality_times.get(c, 0) for c in chains
-        )
-        return max_finality
+        return self._slowest_finality(chains)[1]
+
+    def _slowest_finality(self, chains: List[str]) -> Tuple[str, int]:
+        """
+        Get (slowest chain, its finality time) for a chain set.
+
+        Chain finality times are fixed at init, so results are cached per
+        chain tuple; every window over the same chains reuses them.
+        """
+        key = tuple(chains)
+        cached = self._slowest_finality_cache.get(key)
+        if cached is None:
+            finality_times = self.chain_finality_times
+            slowest_chain = max(key, key=lambda c: finality_times.get(c, 0))
+            cached = (slowest_chain, finality_times.get(slowest_chain, 0))
+            self._slowest_finality_cache[key] = cached
+        return cached
 
 
 # Singleton aggregator
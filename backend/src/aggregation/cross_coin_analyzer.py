@@ -215,15 +215,15 @@ class CrossCoinAnalyzer:
                 liquidities.append(status.total_liquidity)
 
         # Calculate averages
-        avg_health = statistics.mean(health_scores) if health_scores else 0.0
-        avg_tcs = statistics.mean(tcs_scores) if tcs_scores else 0.0
-        avg_sentiment = statistics.mean(sentiments) if sentiments else None
+        avg_health = statistics.fmean(health_scores) if health_scores else 0.0
+        avg_tcs = statistics.fmean(tcs_scores) if tcs_scores else 0.0
+        avg_sentiment = statistics.fmean(sentiments) if sentiments else None
         total_liquidity = sum(liquidities) if liquidities else None
 
         # Calculate depeg metrics
         depegged_count = len(depegged_coins)
         avg_depeg_severity = (
-            statistics.mean(depeg_severities) if depeg_severities else 0.0
+            statistics.fmean(depeg_severities) if depeg_severities else 0.0
         )
 
         # Liquidity crisis detection
@@ -214,9 +214,8 @@ class TimeWindow:
         )
 
         logger.info(
-            f"Generated snapshot for window {self.window_id}: "
-            f"coin={coin}, tcs={snapshot.temporal_confidence:.3f}, "
-            f"events={len(valid_events)}, depegged={is_depegged}"
+            "Generated snapshot for window %s: coin=%s, tcs=%.3f, events=%d, depegged=%s",
+            self.window_id, coin, snapshot.temporal_confidence, len(valid_events), is_depegged
         )
 
         return snapshot
@@ -239,6 +238,10 @@ class WindowManager:
         self.windows: Dict[str, TimeWindow] = {}
         self.current_window: Optional[TimeWindow] = None
 
+        # Set whenever a window reaches FINAL, so consumers can wait for
+        # new snapshots instead of polling get_finalized_snapshots()
+        self.finalized_event = asyncio.Event()
+
     def get_window_id(self, timestamp: datetime) -> str:
         """
         Generate window ID from timestamp.
@@ -311,10 +314,10 @@ class WindowManager:
             # Check if all events are finalized
             if window.all_events_finalized():
                 window.transition_to_final()
+                self.finalized_event.set()
                 logger.info(
-                    f"Window {window.window_id} finalized with "
-                    f"{len(window.events)} events, "
-                    f"TCS={window.snapshot.temporal_confidence:.3f}"
+                    "Window %s finalized with %d events, TCS=%.3f",
+                    window.window_id, len(window.events), window.snapshot.temporal_confidence
                 )
             else:
                 # Grace period expired but not all events finalized
@@ -9,12 +9,14 @@ Continuously polls blockchain RPC endpoints to:
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Set
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set
 from datetime import datetime
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 import asyncio
+import bisect
 import logging
+import time
 
 from src.common.config import config
 from src.confidence.finality_tracker import FinalityTracker
@@ -22,13 +24,16 @@ from src.common.schema import RiskEvent
 
 logger = logging.getLogger(__name__)
 
+# How far back _find_fork_point searches for a common ancestor
+FORK_SEARCH_DEPTH = 100
 
-@dataclass
+
+@dataclass(slots=True)
 class BlockHeader:
     """Blockchain block header information."""
     number: int
-    hash: str
-    parent_hash: str
+    hash: bytes  # Raw hash bytes; hex-encode only for display
+    parent_hash: bytes
     timestamp: int
 
 
@@ -62,15 +67,26 @@ class BlockMonitor(ABC):
 
         # Monitoring state
         self.is_running = False
-        self.last_poll_time: Optional[datetime] = None
+        self.last_poll_ts: Optional[float] = None  # Unix time, formatted in get_stats
         self.poll_count = 0
 
         # Reorg detection stats
         self.reorgs_detected = 0
         self.last_reorg_time: Optional[datetime] = None
 
-        # Event store (for querying affected events)
-        self._event_store: List[RiskEvent] = []
+        # Optional hook called with this monitor after each handled reorg
+        self.on_reorg: Optional[Callable[["BlockMonitor"], None]] = None
+
+        # Head height of the last reorg scan that found no fork
+        self._last_checked_height = -1
+
+        # Event store (for querying affected events), indexed by block number
+        # with a sorted list of occupied heights for range lookups
+        self._events_by_block: Dict[int, List[RiskEvent]] = {}
+        self._event_blocks: List[int] = []
+
+        # Events below this many blocks from the tip can't be reorg'd anymore
+        self._event_retention_blocks = max(self.max_cache_size, FORK_SEARCH_DEPTH)
 
         logger.info(
             f"Initialized BlockMonitor for {chain} "
@@ -86,16 +102,29 @@ class BlockMonitor(ABC):
         """
         Start infinite monitoring loop.
 
-        Continuously polls blockchain and checks for reorgs.
+        Subscribes to new heads over WebSocket when the chain has a ws_url
+        configured, so blocks are checked as they arrive; otherwise (or if
+        the subscription fails) continuously polls the blockchain.
         Runs until stopped or error.
         """
         self.is_running = True
         logger.info(f"🔍 Starting block monitoring for {self.chain}")
 
         try:
-            while self.is_running:
-                await self._poll_and_check()
-                await asyncio.sleep(self.poll_interval_sec())
+            if self.chain_config.ws_url:
+                try:
+                    async for header in self.subscribe_new_heads():
+                        if not self.is_running:
+                            break
+                        await self._process_head(header.number, header)
+                except Exception as e:
+                    if self.is_running:
+                        logger.warning(
+                            f"New-head subscription failed for {self.chain}: {e}. "
+                            f"Falling back to polling"
+                        )
+
+            await self._run_polling()
         except Exception as e:
             logger.error(f"Block monitor crashed for {self.chain}: {e}")
             self.is_running = False
@@ -106,23 +135,76 @@ class BlockMonitor(ABC):
         logger.info(f"Stopping block monitoring for {self.chain}")
         self.is_running = False
 
-    async def _poll_and_check(self):
-        """Poll blockchain and check for reorgs."""
-        try:
-            self.poll_count += 1
-            self.last_poll_time = datetime.utcnow()
+    def subscribe_new_heads(self) -> AsyncIterator[BlockHeader]:
+        """
+        Stream new block headers from the chain's WebSocket endpoint.
 
+        Chains without subscription support raise NotImplementedError,
+        which makes start_monitoring fall back to polling.
+        """
+        raise NotImplementedError(f"No new-head subscription for {self.chain}")
+
+    async def _run_polling(self):
+        """
+        Poll for new blocks until stopped.
+
+        Fetching and checking are pipelined: a producer task keeps polling
+        the chain head into a small queue while the previous head is still
+        being checked for reorgs, so RPC round-trips overlap the checks.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        producer = asyncio.create_task(self._produce_heads(queue))
+
+        try:
+            while True:
+                head = await queue.get()
+                if head is None:  # Producer stopped
+                    break
+                await self._process_head(*head)
+        finally:
+            producer.cancel()
+
+    async def _produce_heads(self, queue: asyncio.Queue):
+        """Poll the chain head into the queue every poll interval."""
+        while self.is_running:
+            head = await self._fetch_head()
+            if head is not None:
+                await queue.put(head)
+            await asyncio.sleep(self.poll_interval_sec())
+
+        await queue.put(None)  # Signal end of stream
+
+    async def _fetch_head(self) -> Optional[tuple]:
+        """Fetch the current block height and its header from the chain."""
+        try:
             # Get current block
             current_height = await self.tracker.get_current_block_number()
 
-            # Fetch and cache new block header
+            # Fetch new block header
             new_header = await self.get_block_header(current_height)
+
+            return current_height, new_header
+
+        except Exception as e:
+            logger.error(f"Error in poll cycle for {self.chain}: {e}")
+            return None
+
+    async def _process_head(self, current_height: int, new_header: Optional[BlockHeader]):
+        """Cache the chain head and check recent blocks for reorgs."""
+        try:
+            self.poll_count += 1
+            self.last_poll_ts = time.time()
+
+            # Cache new block header
             if new_header:
                 self._add_to_cache(new_header)
 
             # Check recent blocks for hash mismatches (reorg detection)
             await self._check_for_reorg(current_height)
 
+            # Drop tracked events too deep to be affected by a reorg
+            self._prune_events_below(current_height - self._event_retention_blocks)
+
             # Log progress periodically
             if self.poll_count % 100 == 0:
                 logger.info(
@@ -133,7 +215,7 @@ class BlockMonitor(ABC):
                 )
 
         except Exception as e:
-            logger.error(f"Error in poll cycle for {self.chain}: {e}")
+            logger.error(f"Error processing block {current_height} on {self.chain}: {e}")
 
     async def _check_for_reorg(self, current_height: int):
         """
@@ -141,28 +223,46 @@ class BlockMonitor(ABC):
 
         Compares cached block hashes with current chain state.
         If hashes don't match -> reorg detected!
+
+        Skipped while the head hasn't advanced past the last clean scan:
+        polls often land between blocks and would re-fetch the same range.
         """
+        if current_height <= self._last_checked_height:
+            return
+
         # Check last 10 blocks (or however many we have cached)
         check_range = min(10, len(self.block_cache))
         start_height = max(current_height - check_range, 0)
 
-        for height in range(start_height, current_height):
-            if height not in self.block_cache:
-                continue
+        heights = [
+            height for height in range(start_height, current_height)
+            if height in self.block_cache
+        ]
+        if not heights:
+            self._last_checked_height = current_height
+            return
+
+        # Fetch all headers in one concurrent round instead of one RPC at a time
+        actual_headers = await asyncio.gather(
+            *(self.get_block_header(height) for height in heights)
+        )
+        fetched = dict(zip(heights, actual_headers))
 
+        for height, actual_header in fetched.items():
             # Get cached hash
-            cached_header = self.block_cache[height]
+            cached_header = self.block_cache.get(height)
+            if cached_header is None:
+                continue
             expected_hash = cached_header.hash
 
-            # Get current hash from chain
-            actual_header = await self.get_block_header(height)
+            # Compare against current hash from chain
             if actual_header is None:
                 # Block doesn't exist anymore -> definitely a reorg
                 logger.warning(
                     f"🚨 REORG: Block {height} on {self.chain} no longer exists! "
-                    f"(expected hash: {expected_hash[:10]}...)"
+                    f"(expected hash: {expected_hash.hex()[:10]}...)"
                 )
-                await self._handle_fork(height, None)
+                await self._handle_fork(height, None, fetched)
                 return
 
             # Compare hashes
@@ -170,13 +270,21 @@ class BlockMonitor(ABC):
                 # FORK DETECTED!
                 logger.warning(
                     f"🚨 REORG: Hash mismatch at block {height} on {self.chain}! "
-                    f"Expected: {expected_hash[:10]}..., "
-                    f"Actual: {actual_header.hash[:10]}..."
+                    f"Expected: {expected_hash.hex()[:10]}..., "
+                    f"Actual: {actual_header.hash.hex()[:10]}..."
                 )
-                await self._handle_fork(height, actual_header)
+                await self._handle_fork(height, actual_header, fetched)
                 return
 
-    async def _handle_fork(self, fork_height: int, new_block: Optional[BlockHeader]):
+        # Only a clean scan is remembered, so the range is re-checked after a fork
+        self._last_checked_height = current_height
+
+    async def _handle_fork(
+        self,
+        fork_height: int,
+        new_block: Optional[BlockHeader],
+        fetched: Optional[Dict[int, Optional[BlockHeader]]] = None
+    ):
         """
         Handle detected fork.
 
@@ -184,11 +292,14 @@ class BlockMonitor(ABC):
         2. Identify affected events
         3. Emit reorg signal to handler
         4. Update cache with new canonical chain
+
+        `fetched` holds headers already pulled by the reorg scan, so the
+        fork search doesn't request them again.
         """
         logger.error(f"🚨 FORK DETECTED on {self.chain} at height {fork_height}")
 
         # Find fork point (backtrack to where chains diverge)
-        fork_point = await self._find_fork_point(fork_height)
+        fork_point = await self._find_fork_point(fork_height, fetched)
         affected_range = (fork_point, fork_height)
 
         logger.error(
@@ -218,7 +329,7 @@ class BlockMonitor(ABC):
             )
 
             logger.info(
-                f"ReorgHandler created {len(correction_events)} correction events"
+                "ReorgHandler created %d correction events", len(correction_events)
             )
 
         # Update stats
@@ -228,28 +339,56 @@ class BlockMonitor(ABC):
         # Clear cache for affected range and re-fetch
         self._clear_cache_range(fork_point, fork_height)
 
-    async def _find_fork_point(self, start_height: int) -> int:
+        if self.on_reorg is not None:
+            self.on_reorg(self)
+
+    async def _find_fork_point(
+        self,
+        start_height: int,
+        fetched: Optional[Dict[int, Optional[BlockHeader]]] = None
+    ) -> int:
         """
         Find fork point by backtracking until hashes match.
 
-        Uses binary search to efficiently find where chains diverged.
+        Uses binary search to efficiently find where chains diverged:
+        cached heights below the fork still match the chain, heights at or
+        above it don't, so the common ancestor is the last matching height.
+        O(log n) header fetches instead of one per cached block, minus any
+        already in `fetched`.
         """
-        # Simple implementation: linear backtrack
-        # TODO: Binary search for efficiency
+        if fetched is None:
+            fetched = {}
 
-        for height in range(start_height, max(0, start_height - 100), -1):
-            if height not in self.block_cache:
-                continue
+        floor_height = max(0, start_height - FORK_SEARCH_DEPTH)
 
-            cached_header = self.block_cache[height]
-            actual_header = await self.get_block_header(height)
+        # Only cached heights can be compared
+        heights = sorted(
+            height for height in self.block_cache
+            if floor_height < height <= start_height
+        )
 
-            if actual_header and actual_header.hash == cached_header.hash:
-                # Found common ancestor
-                return height
+        # Find the first cached height whose hash no longer matches
+        lo, hi = 0, len(heights)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            height = heights[mid]
+            if height in fetched:
+                actual_header = fetched[height]
+            else:
+                actual_header = await self.get_block_header(height)
+                fetched[height] = actual_header
+
+            if actual_header and actual_header.hash == self.block_cache[height].hash:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo > 0:
+            # Found common ancestor
+            return heights[lo - 1]
 
         # Couldn't find fork point in last 100 blocks
-        return max(0, start_height - 100)
+        return floor_height
 
     def _get_events_in_range(self, start_height: int, end_height: int) -> List[RiskEvent]:
         """
@@ -257,17 +396,20 @@ class BlockMonitor(ABC):
 
         Returns events with block_number in [start_height, end_height].
         """
-        affected = []
+        blocks = self._event_blocks
 
-        for event in self._event_store:
-            if event.block_number is None:
-                continue
+        # Forks near the tip usually sit above every registered event
+        if not blocks or start_height > blocks[-1] or end_height < blocks[0]:
+            return []
 
-            if start_height <= event.block_number <= end_height:
-                if event.chain == self.chain:
-                    affected.append(event)
+        lo = bisect.bisect_left(blocks, start_height)
+        hi = bisect.bisect_right(blocks, end_height)
 
-        return affected
+        return [
+            event
+            for height in blocks[lo:hi]
+            for event in self._events_by_block[height]
+        ]
 
     def register_event(self, event: RiskEvent):
         """
@@ -277,7 +419,44 @@ class BlockMonitor(ABC):
         If reorg affects their block, they'll be invalidated.
         """
         if event.block_number is not None and event.chain == self.chain:
-            self._event_store.append(event)
+            events = self._events_by_block.get(event.block_number)
+            if events is None:
+                events = self._events_by_block[event.block_number] = []
+                bisect.insort(self._event_blocks, event.block_number)
+            events.append(event)
+
+    def register_events(self, events: List[RiskEvent]):
+        """
+        Register a batch of events to track for reorgs.
+
+        Same filtering as register_event, but new block heights are merged
+        into the sorted index with a single sort instead of one insort each.
+        """
+        events_by_block = self._events_by_block
+        new_blocks = []
+
+        for event in events:
+            if event.block_number is None or event.chain != self.chain:
+                continue
+            block_events = events_by_block.get(event.block_number)
+            if block_events is None:
+                block_events = events_by_block[event.block_number] = []
+                new_blocks.append(event.block_number)
+            block_events.append(event)
+
+        if new_blocks:
+            self._event_blocks.extend(new_blocks)
+            self._event_blocks.sort()
+
+    def _prune_events_below(self, height: int):
+        """Stop tracking events in blocks below the given height."""
+        cut = bisect.bisect_left(self._event_blocks, height)
+        if cut == 0:
+            return
+
+        for block_number in self._event_blocks[:cut]:
+            del self._events_by_block[block_number]
+        del self._event_blocks[:cut]
 
     def _add_to_cache(self, header: BlockHeader):
         """Add block header to cache (LRU)."""
@@ -310,11 +489,31 @@ class BlockMonitor(ABC):
             "cache_size": len(self.block_cache),
             "max_cache_size": self.max_cache_size,
             "reorgs_detected": self.reorgs_detected,
-            "last_poll_time": self.last_poll_time.isoformat() if self.last_poll_time else None,
+            "last_poll_time": (
+                datetime.utcfromtimestamp(self.last_poll_ts).isoformat()
+                if self.last_poll_ts else None
+            ),
             "last_reorg_time": self.last_reorg_time.isoformat() if self.last_reorg_time else None
         }
 
 
+async def _subscribe_evm_new_heads(ws_url: str) -> AsyncIterator[BlockHeader]:
+    """Yield headers from an EVM node's eth_subscribe("newHeads") stream."""
+    from web3 import AsyncWeb3, WebSocketProvider
+
+    async with AsyncWeb3(WebSocketProvider(ws_url)) as w3:
+        await w3.eth.subscribe("newHeads")
+
+        async for message in w3.socket.process_subscriptions():
+            head = message["result"]
+            yield BlockHeader(
+                number=head['number'],
+                hash=head['hash'],
+                parent_hash=head['parentHash'],
+                timestamp=head['timestamp']
+            )
+
+
 class EthereumBlockMonitor(BlockMonitor):
     """Block monitor for Ethereum."""
 
@@ -322,20 +521,23 @@ class EthereumBlockMonitor(BlockMonitor):
         """Poll every 3 seconds (Ethereum block time ~12s)."""
         return 3.0
 
+    def subscribe_new_heads(self) -> AsyncIterator[BlockHeader]:
+        """Subscribe to Ethereum newHeads over WebSocket."""
+        return _subscribe_evm_new_heads(self.chain_config.ws_url)
+
     async def get_block_header(self, block_number: int) -> Optional[BlockHeader]:
         """Fetch Ethereum block header."""
         try:
-            # Use web3.py to get block
-            block = self.tracker.w3.eth.get_block(block_number)
+            block = await self.tracker.get_block(block_number)
 
             return BlockHeader(
                 number=block['number'],
-                hash=block['hash'].hex(),
-                parent_hash=block['parentHash'].hex(),
+                hash=block['hash'],
+                parent_hash=block['parentHash'],
                 timestamp=block['timestamp']
             )
         except Exception as e:
-            logger.debug(f"Could not fetch Ethereum block {block_number}: {e}")
+            logger.debug("Could not fetch Ethereum block %s: %s", block_number, e)
             return None
 
 
@@ -346,20 +548,24 @@ class ArbitrumBlockMonitor(BlockMonitor):
         """Poll every 500ms (Arbitrum block time ~250ms)."""
         return 0.5
 
+    def subscribe_new_heads(self) -> AsyncIterator[BlockHeader]:
+        """Subscribe to Arbitrum newHeads over WebSocket."""
+        return _subscribe_evm_new_heads(self.chain_config.ws_url)
+
     async def get_block_header(self, block_number: int) -> Optional[BlockHeader]:
         """Fetch Arbitrum block header."""
         try:
             # Arbitrum uses same web3 interface as Ethereum
-            block = self.tracker.w3.eth.get_block(block_number)
+            block = await self.tracker.get_block(block_number)
 
             return BlockHeader(
                 number=block['number'],
-                hash=block['hash'].hex(),
-                parent_hash=block['parentHash'].hex(),
+                hash=block['hash'],
+                parent_hash=block['parentHash'],
                 timestamp=block['timestamp']
             )
         except Exception as e:
-            logger.debug(f"Could not fetch Arbitrum block {block_number}: {e}")
+            logger.debug("Could not fetch Arbitrum block %s: %s", block_number, e)
             return None
 
 
@@ -370,6 +576,26 @@ class SolanaBlockMonitor(BlockMonitor):
         """Poll every 400ms (Solana slot time ~400ms)."""
         return 0.4
 
+    async def subscribe_new_heads(self) -> AsyncIterator[BlockHeader]:
+        """
+        Subscribe to Solana slot updates over WebSocket.
+
+        slotSubscribe is used rather than blockSubscribe, which most public
+        RPC nodes leave disabled; each new slot's header is then fetched.
+        """
+        from solana.rpc.websocket_api import connect
+
+        async with connect(self.chain_config.ws_url) as websocket:
+            await websocket.slot_subscribe()
+            await websocket.recv()  # Subscription confirmation
+
+            async for messages in websocket:
+                for message in messages:
+                    slot = message.result.slot
+                    header = await self.get_block_header(slot)
+                    if header:
+                        yield header
+
     async def get_block_header(self, block_number: int) -> Optional[BlockHeader]:
         """Fetch Solana block/slot header."""
         try:
@@ -384,10 +610,10 @@ class SolanaBlockMonitor(BlockMonitor):
             # Solana block structure is different
             return BlockHeader(
                 number=block_number,
-                hash=block.blockhash if hasattr(block, 'blockhash') else str(block_number),
-                parent_hash=block.previous_blockhash if hasattr(block, 'previous_blockhash') else "",
+                hash=bytes(block.blockhash) if hasattr(block, 'blockhash') else str(block_number).encode(),
+                parent_hash=bytes(block.previous_blockhash) if hasattr(block, 'previous_blockhash') else b"",
                 timestamp=block.block_time if hasattr(block, 'block_time') else 0
             )
         except Exception as e:
-            logger.debug(f"Could not fetch Solana slot {block_number}: {e}")
+            logger.debug("Could not fetch Solana slot %s: %s", block_number, e)
             return None
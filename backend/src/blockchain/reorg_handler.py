@@ -9,16 +9,24 @@ Handles blockchain reorganizations by:
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import Deque, List, Dict, Optional, Tuple
 from datetime import datetime
+from collections import deque
+import bisect
 import logging
 
 from src.common.schema import RiskEvent
 
 logger = logging.getLogger(__name__)
 
+# Max timestamp distance for a new-chain event to replace an invalidated one
+REPLACEMENT_WINDOW_SEC = 60
 
-@dataclass
+# Reorg records kept per chain (older ones drop off; stats stay cumulative)
+REORG_HISTORY_MAXLEN = 10_000
+
+
+@dataclass(slots=True)
 class ReorgEvent:
     """Record of a blockchain reorganization."""
     chain: str
@@ -46,16 +54,19 @@ class ReorgHandler:
     """
 
     def __init__(self):
-        # Track reorg history per chain
-        self.reorg_history: Dict[str, List[ReorgEvent]] = {
-            "ethereum": [],
-            "arbitrum": [],
-            "solana": []
+        # Track recent reorg history per chain
+        self.reorg_history: Dict[str, Deque[ReorgEvent]] = {
+            "ethereum": deque(maxlen=REORG_HISTORY_MAXLEN),
+            "arbitrum": deque(maxlen=REORG_HISTORY_MAXLEN),
+            "solana": deque(maxlen=REORG_HISTORY_MAXLEN)
         }
 
         # Track event versions
         self.event_versions: Dict[str, int] = {}  # event_id -> version
 
+        # Running reorg stats per chain, updated as reorgs are recorded
+        self._stats: Dict[str, Dict] = {}
+
     def detect_reorg(
         self,
         chain: str,
@@ -77,8 +88,8 @@ class ReorgHandler:
 
         if is_reorg:
             logger.warning(
-                f"Reorg detected on {chain}: "
-                f"expected block {expected_block}, got {actual_block}"
+                "Reorg detected on %s: expected block %s, got %s",
+                chain, expected_block, actual_block
             )
 
         return is_reorg
@@ -97,26 +108,57 @@ class ReorgHandler:
             affected_events: Events that were in reorg'd blocks
             new_events: Replacement events from new canonical chain
 
+        Returns:
+            List of correction events to emit
+        """
+        if new_events:
+            # Match by coin + source + approximate timestamp
+            index = self._build_replacement_index(new_events)
+            find = self._find_replacement_event
+            pairs = [(old_event, find(old_event, index)) for old_event in affected_events]
+        else:
+            pairs = [(old_event, None) for old_event in affected_events]
+
+        return self.handle_reorg_batch(
+            chain,
+            pairs,
+            new_block=new_events[0].block_number if new_events else 0
+        )
+
+    def handle_reorg_batch(
+        self,
+        chain: str,
+        pairs: List[Tuple[RiskEvent, Optional[RiskEvent]]],
+        new_block: Optional[int] = None
+    ) -> List[RiskEvent]:
+        """
+        Apply a reorg to already-matched (old, replacement) event pairs.
+
+        All events are invalidated and versioned in one pass with a single
+        detection timestamp and one reorg record, instead of per event.
+
+        Args:
+            chain: Blockchain name
+            pairs: Invalidated events with their replacement (None if removed)
+            new_block: Block the chain moved to (defaults to the first
+                replacement's block)
+
         Returns:
             List of correction events to emit
         """
         correction_events = []
+        removed = 0
+        detected_at = datetime.utcnow()
 
         logger.error(
-            f"🚨 REORG HANDLER: Processing {len(affected_events)} "
-            f"affected events on {chain}"
+            "🚨 REORG HANDLER: Processing %d affected events on %s",
+            len(pairs), chain
         )
 
-        for old_event in affected_events:
+        for old_event, replacement in pairs:
             # Mark old event as invalidated
             old_event.invalidated = True
-            old_event.reorg_detected_at = datetime.utcnow()
-
-            # Find replacement event (if any)
-            replacement = None
-            if new_events:
-                # Try to match by coin + source + approximate timestamp
-                replacement = self._find_replacement_event(old_event, new_events)
+            old_event.reorg_detected_at = detected_at
 
             if replacement:
                 # Create correction event
@@ -124,35 +166,83 @@ class ReorgHandler:
                 correction_events.append(correction)
 
                 old_event.replacement_event_id = correction.event_id
-
-                logger.info(
-                    f"Correction event created: {old_event.event_id} -> "
-                    f"{correction.event_id} (v{correction.event_version})"
-                )
             else:
                 # No replacement found - event was removed in reorg
-                logger.warning(
-                    f"No replacement found for invalidated event: "
-                    f"{old_event.event_id} (removed in reorg)"
+                removed += 1
+                logger.debug(
+                    "No replacement found for invalidated event: %s (removed in reorg)",
+                    old_event.event_id
                 )
 
+        logger.info(
+            "Reorg on %s: %d correction events, %d events removed",
+            chain, len(correction_events), removed
+        )
+
+        if new_block is None:
+            new_block = next(
+                (new.block_number for _, new in pairs if new is not None), 0
+            )
+
         # Record reorg
         reorg_record = ReorgEvent(
             chain=chain,
-            timestamp=datetime.utcnow(),
-            original_block=affected_events[0].block_number if affected_events else 0,
-            new_block=new_events[0].block_number if new_events else 0,
-            depth=len(affected_events),
-            affected_events=[e.event_id for e in affected_events]
+            timestamp=detected_at,
+            original_block=pairs[0][0].block_number if pairs else 0,
+            new_block=new_block,
+            depth=len(pairs),
+            affected_events=[old.event_id for old, _ in pairs]
         )
         self.reorg_history[chain].append(reorg_record)
+        self._record_stats(reorg_record)
 
         return correction_events
 
+    def _record_stats(self, reorg_record: ReorgEvent):
+        """Fold a new reorg record into its chain's running stats."""
+        stats = self._stats.get(reorg_record.chain)
+        if stats is None:
+            stats = self._stats[reorg_record.chain] = {
+                "chain": reorg_record.chain,
+                "reorg_count": 0,
+                "total_affected_events": 0,
+                "max_depth": 0
+            }
+
+        stats["reorg_count"] += 1
+        stats["total_affected_events"] += len(reorg_record.affected_events)
+        stats["max_depth"] = max(stats["max_depth"], reorg_record.depth)
+        stats["latest_reorg"] = reorg_record.timestamp.isoformat()
+
+    def _build_replacement_index(
+        self,
+        new_events: List[RiskEvent]
+    ) -> Dict[Tuple[str, str], Tuple[List[float], List[RiskEvent]]]:
+        """
+        Bucket replacement candidates by (coin, source).
+
+        Each bucket holds epoch timestamps in ascending order with the
+        matching events alongside, so lookups can bisect the time window.
+        """
+        buckets: Dict[Tuple[str, str], List[Tuple[float, int, RiskEvent]]] = {}
+        for position, new_event in enumerate(new_events):
+            buckets.setdefault((new_event.coin, new_event.source), []).append(
+                (new_event.timestamp.timestamp(), position, new_event)
+            )
+
+        index = {}
+        for key, entries in buckets.items():
+            entries.sort(key=lambda entry: entry[:2])
+            index[key] = (
+                [ts for ts, _, _ in entries],
+                [event for _, _, event in entries]
+            )
+        return index
+
     def _find_replacement_event(
         self,
         old_event: RiskEvent,
-        new_events: List[RiskEvent]
+        index: Dict[Tuple[str, str], Tuple[List[float], List[RiskEvent]]]
     ) -> Optional[RiskEvent]:
         """
         Find replacement event in new canonical chain.
@@ -160,18 +250,28 @@ class ReorgHandler:
         Match criteria:
         - Same coin
         - Same source
-        - Similar timestamp (within 60 seconds)
+        - Similar timestamp (within 60 seconds), closest one wins
         """
-        for new_event in new_events:
-            if (new_event.coin == old_event.coin and
-                new_event.source == old_event.source):
-
-                # Check timestamp proximity (within 1 minute)
-                time_diff = abs((new_event.timestamp - old_event.timestamp).total_seconds())
-                if time_diff < 60:
-                    return new_event
-
-        return None
+        bucket = index.get((old_event.coin, old_event.source))
+        if bucket is None:
+            return None
+        timestamps, events = bucket
+
+        old_ts = old_event.timestamp.timestamp()
+        best = None
+        best_diff = REPLACEMENT_WINDOW_SEC
+
+        # Scan forward from the first candidate inside the window
+        start = bisect.bisect_right(timestamps, old_ts - REPLACEMENT_WINDOW_SEC)
+        for i in range(start, len(timestamps)):
+            if timestamps[i] >= old_ts + REPLACEMENT_WINDOW_SEC:
+                break
+            time_diff = abs(timestamps[i] - old_ts)
+            if time_diff < best_diff:
+                best = events[i]
+                best_diff = time_diff
+
+        return best
 
     def _create_correction_event(
         self,
@@ -217,18 +317,19 @@ class ReorgHandler:
             original_block_number=old_event.block_number  # Record original block
         )
 
-        logger.info(
-            f"Created correction event: {correction.event_id} v{new_version} "
-            f"(block {old_event.block_number} -> {new_event.block_number})"
+        logger.debug(
+            "Created correction event: %s v%d (block %s -> %s)",
+            correction.event_id, new_version,
+            old_event.block_number, new_event.block_number
         )
 
         return correction
 
     def get_reorg_stats(self, chain: str) -> Dict:
         """Get reorg statistics for a chain."""
-        reorgs = self.reorg_history.get(chain, [])
+        stats = self._stats.get(chain)
 
-        if not reorgs:
+        if stats is None:
             return {
                 "chain": chain,
                 "reorg_count": 0,
@@ -236,13 +337,7 @@ class ReorgHandler:
                 "max_depth": 0
             }
 
-        return {
-            "chain": chain,
-            "reorg_count": len(reorgs),
-            "total_affected_events": sum(len(r.affected_events) for r in reorgs),
-            "max_depth": max(r.depth for r in reorgs),
-            "latest_reorg": reorgs[-1].timestamp.isoformat() if reorgs else None
-        }
+        return dict(stats)
 
     def get_all_reorg_stats(self) -> Dict[str, Dict]:
         """Get reorg statistics for all chains."""
@@ -276,8 +371,8 @@ class ReorgHandler:
 
         if event.confirmation_count < min_confirmations:
             logger.debug(
-                f"Event {event.event_id} has {event.confirmation_count} confirmations, "
-                f"waiting for {min_confirmations}"
+                "Event %s has %d confirmations, waiting for %d",
+                event.event_id, event.confirmation_count, min_confirmations
             )
             return True
 
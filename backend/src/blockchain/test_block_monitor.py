@@ -163,5 +163,7 @@ async def test_all_monitors():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(test_all_monitors())
+    from src.common.event_loop import event_loop_factory
+
+    success = asyncio.run(test_all_monitors(), loop_factory=event_loop_factory())
     exit(0 if success else 1)
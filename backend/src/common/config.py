@@ -4,7 +4,7 @@ Supports Ethereum, Arbitrum, and Solana with heterogeneous finality settings.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional
 import os
 from dotenv import load_dotenv
 
@@ -33,6 +33,9 @@ class ChainConfig:
     max_reorg_depth: int
     reorg_probability: float
 
+    # WebSocket endpoint for new-head subscriptions (None = poll only)
+    ws_url: Optional[str] = None
+
 
 @dataclass
 class CoinConfig:
@@ -60,6 +63,7 @@ class Config:
         "ethereum": ChainConfig(
             name="ethereum",
             rpc_url=os.getenv("ETHEREUM_RPC_URL", "https://eth.llamarpc.com"),
+            ws_url=os.getenv("ETHEREUM_WS_URL"),
             fallback_rpcs=[
                 "https://rpc.ankr.com/eth",
                 "https://eth.rpc.blxrbdn.com"
@@ -77,6 +81,7 @@ class Config:
         "arbitrum": ChainConfig(
             name="arbitrum",
             rpc_url=os.getenv("ARBITRUM_RPC_URL", "https://arb1.arbitrum.io/rpc"),
+            ws_url=os.getenv("ARBITRUM_WS_URL"),
             fallback_rpcs=[
                 "https://rpc.ankr.com/arbitrum",
                 "https://arbitrum.llamarpc.com"
@@ -94,6 +99,7 @@ class Config:
         "solana": ChainConfig(
             name="solana",
             rpc_url=os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com"),
+            ws_url=os.getenv("SOLANA_WS_URL"),
             fallback_rpcs=[
                 "https://solana-api.projectserum.com",
                 "https://rpc.ankr.com/solana"
@@ -201,7 +207,9 @@ class Config:
         "price_interval_sec": 60,
         "liquidity_interval_sec": 300,
         "volatility_interval_sec": 3600,
-        "sentiment_interval_sec": 3600
+        "sentiment_interval_sec": 3600,
+        # Max in-flight source fetches across all pollers
+        "max_concurrent_fetches": 16
     }
 
     # Sentiment sources
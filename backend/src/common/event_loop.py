@@ -0,0 +1,23 @@
+"""
+Event loop selection for the pipeline entry points.
+
+The driver and demos are dominated by asyncio scheduling (RPC coroutines,
+gathers, monitor poll timers), so they run on uvloop when it is installed.
+"""
+
+from typing import Callable, Optional
+import asyncio
+
+
+def event_loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """
+    Get a loop factory for asyncio.run(..., loop_factory=...).
+
+    Returns uvloop's factory when available, otherwise None (the default
+    asyncio loop).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
@@ -0,0 +1,59 @@
+"""
+Shared HTTP session for off-chain data sources.
+
+Sources used to open a new aiohttp.ClientSession per request, paying a
+TCP + TLS handshake every poll. They now share one keep-alive connection
+pool, created lazily on the running event loop.
+"""
+
+from typing import Optional
+import asyncio
+import logging
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Connection pool sizing (a handful of API hosts, polled concurrently)
+POOL_LIMIT = 32
+POOL_LIMIT_PER_HOST = 8
+POOL_KEEPALIVE_SEC = 60
+
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Get the shared session, creating it on first use.
+
+    A session is bound to the loop it was created on, so a new one is
+    made if the previous session was closed or belongs to another loop.
+    """
+    global _session, _session_loop
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=POOL_LIMIT,
+                limit_per_host=POOL_LIMIT_PER_HOST,
+                keepalive_timeout=POOL_KEEPALIVE_SEC
+            )
+        )
+        _session_loop = loop
+        logger.debug("Opened shared HTTP session")
+
+    return _session
+
+
+async def close_session():
+    """Close the shared session (call once on shutdown)."""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.debug("Closed shared HTTP session")
+
+    _session = None
+    _session_loop = None
@@ -17,6 +17,14 @@ class FinalityTier(Enum):
     TIER3 = "tier3"  # 1.0 confidence - "final"
 
 
+# Numeric confidence per finality tier value (hot path: read per event)
+FINALITY_TIER_CONFIDENCE: Dict[str, float] = {
+    FinalityTier.TIER1.value: 0.3,
+    FinalityTier.TIER2.value: 0.8,
+    FinalityTier.TIER3.value: 1.0
+}
+
+
 class WindowState(Enum):
     """Window state machine states."""
     OPEN = "OPEN"              # Accepting new events
@@ -42,7 +50,7 @@ class ConfidenceBreakdown:
     temporal_confidence: float  # Final TCS = (f * c * comp) / stale
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskEvent:
     """
     Unified event schema for all risk data across chains and sources.
@@ -54,6 +62,10 @@ class RiskEvent:
     - Reorg-aware event versioning
     - Window state machine tracking
     - Cross-chain aggregation
+
+    Slotted: every hot loop reads event attributes, and monitors keep many
+    events alive. Not frozen, since finality, reorg and quality stages
+    update events in place.
     """
 
     # ============================================
@@ -248,12 +260,7 @@ class RiskEvent:
 
     def get_confidence_tier_value(self) -> float:
         """Get numeric confidence value for current finality tier."""
-        tier_map = {
-            FinalityTier.TIER1.value: 0.3,
-            FinalityTier.TIER2.value: 0.8,
-            FinalityTier.TIER3.value: 1.0
-        }
-        return tier_map.get(self.finality_tier, 0.0)
+        return FINALITY_TIER_CONFIDENCE.get(self.finality_tier, 0.0)
 
     def is_stale(self, max_age_sec: int = 600) -> bool:
         """Check if event is stale based on timestamp."""
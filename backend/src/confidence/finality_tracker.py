@@ -17,6 +17,18 @@ from src.common.config import config, ChainConfig
 
 logger = logging.getLogger(__name__)
 
+# Numeric confidence per finality tier
+_FINALITY_CONFIDENCE: Dict[FinalityTier, float] = {
+    FinalityTier.TIER1: 0.3,
+    FinalityTier.TIER2: 0.8,
+    FinalityTier.TIER3: 1.0
+}
+
+# Keep-alive HTTP pool for EVM RPC clients. Monitors poll every few hundred
+# ms to a few seconds, so idle connections must outlive the poll interval.
+RPC_POOL_LIMIT_PER_HOST = 20
+RPC_POOL_KEEPALIVE_SEC = 300
+
 
 class FinalityTracker(ABC):
     """Abstract base class for chain-specific finality tracking."""
@@ -51,12 +63,7 @@ class FinalityTracker(ABC):
 
     def get_finality_confidence(self, tier: FinalityTier) -> float:
         """Get numeric confidence value for finality tier."""
-        confidence_map = {
-            FinalityTier.TIER1: 0.3,
-            FinalityTier.TIER2: 0.8,
-            FinalityTier.TIER3: 1.0
-        }
-        return confidence_map[tier]
+        return _FINALITY_CONFIDENCE[tier]
 
     async def update_event_finality(self, event: RiskEvent) -> RiskEvent:
         """
@@ -135,15 +142,63 @@ class FinalityTracker(ABC):
 
         return event
 
+    async def close(self):
+        """Release RPC connections held by this tracker (call once on shutdown)."""
+
 
-class EthereumFinalityTracker(FinalityTracker):
+class EVMFinalityTracker(FinalityTracker):
+    """
+    Shared Web3 plumbing for EVM chains (Ethereum, Arbitrum).
+
+    The sync client is only used for the startup connectivity check; RPC
+    calls made from the event loop go through async_w3 so they don't block
+    other monitors.
+    """
+
+    def __init__(self, chain_config: ChainConfig):
+        super().__init__(chain_config)
+        from web3 import Web3, AsyncWeb3
+        self.w3 = Web3(Web3.HTTPProvider(self.chain_config.rpc_url))
+        self.async_w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(self.chain_config.rpc_url))
+        self._rpc_session = None
+        self._rpc_session_lock = asyncio.Lock()
+
+    async def _async_eth(self):
+        """Get the async eth module, attaching the keep-alive pool on first use."""
+        if self._rpc_session is None:
+            # Concurrent first callers wait here, so none of them reaches the
+            # provider before the pool is attached
+            async with self._rpc_session_lock:
+                if self._rpc_session is None:
+                    # aiohttp sessions need a running loop, so this can't happen in __init__
+                    import aiohttp
+                    session = aiohttp.ClientSession(
+                        connector=aiohttp.TCPConnector(
+                            limit_per_host=RPC_POOL_LIMIT_PER_HOST,
+                            keepalive_timeout=RPC_POOL_KEEPALIVE_SEC
+                        )
+                    )
+                    await self.async_w3.provider.cache_async_session(session)
+                    self._rpc_session = session
+        return self.async_w3.eth
+
+    async def close(self):
+        """Close the keep-alive RPC pool, if one was attached."""
+        if self._rpc_session is not None and not self._rpc_session.closed:
+            await self._rpc_session.close()
+        self._rpc_session = None
+
+    async def get_block(self, block_number: int):
+        """Fetch a block over the pooled async RPC connection."""
+        eth = await self._async_eth()
+        return await eth.get_block(block_number)
+
+
+class EthereumFinalityTracker(EVMFinalityTracker):
     """Finality tracker for Ethereum (PoS with 12.8 min finality)."""
 
     def __init__(self):
         super().__init__(config.CHAINS["ethereum"])
-        # Initialize Web3 connection
-        from web3 import Web3
-        self.w3 = Web3(Web3.HTTPProvider(self.chain_config.rpc_url))
 
         # Test connection
         try:
@@ -158,8 +213,8 @@ class EthereumFinalityTracker(FinalityTracker):
     async def get_current_block_number(self) -> int:
         """Get current Ethereum block number."""
         try:
-            # web3.py sync call wrapped for async compatibility
-            return self.w3.eth.block_number
+            eth = await self._async_eth()
+            return await eth.block_number
         except Exception as e:
             logger.error(f"Error getting Ethereum block number: {e}")
             raise
@@ -167,7 +222,7 @@ class EthereumFinalityTracker(FinalityTracker):
     async def check_block_exists(self, block_number: int) -> bool:
         """Check if block exists (reorg detection)."""
         try:
-            block = self.w3.eth.get_block(block_number)
+            block = await self.get_block(block_number)
             return block is not None
         except Exception as e:
             # Block not found or RPC error
@@ -175,7 +230,7 @@ class EthereumFinalityTracker(FinalityTracker):
             return False
 
 
-class ArbitrumFinalityTracker(FinalityTracker):
+class ArbitrumFinalityTracker(EVMFinalityTracker):
     """
     Finality tracker for Arbitrum (L2 with ~13 sec batch posting + L1 finality).
 
@@ -186,10 +241,8 @@ class ArbitrumFinalityTracker(FinalityTracker):
     """
 
     def __init__(self):
+        # Arbitrum uses same Web3 interface as Ethereum
         super().__init__(config.CHAINS["arbitrum"])
-        # Initialize Web3 connection (Arbitrum uses same interface as Ethereum)
-        from web3 import Web3
-        self.w3 = Web3(Web3.HTTPProvider(self.chain_config.rpc_url))
 
         # Test connection
         try:
@@ -204,7 +257,8 @@ class ArbitrumFinalityTracker(FinalityTracker):
     async def get_current_block_number(self) -> int:
         """Get current Arbitrum block number."""
         try:
-            return self.w3.eth.block_number
+            eth = await self._async_eth()
+            return await eth.block_number
         except Exception as e:
             logger.error(f"Error getting Arbitrum block number: {e}")
             raise
@@ -212,7 +266,7 @@ class ArbitrumFinalityTracker(FinalityTracker):
     async def check_block_exists(self, block_number: int) -> bool:
         """Check if block exists (reorg detection)."""
         try:
-            block = self.w3.eth.get_block(block_number)
+            block = await self.get_block(block_number)
             return block is not None
         except Exception as e:
             logger.debug(f"Block {block_number} not found on Arbitrum: {e}")
@@ -284,6 +338,11 @@ class FinalityTrackerRegistry:
 
         return await tracker.update_event_finality(event)
 
+    async def close(self):
+        """Close every tracker's RPC connections (call once on shutdown)."""
+        for tracker in self.trackers.values():
+            await tracker.close()
+
     async def monitor_finality_upgrades(
         self,
         events: list[RiskEvent],
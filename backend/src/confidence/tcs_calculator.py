@@ -15,6 +15,7 @@ as part of feature-based architecture refactoring.
 
 from datetime import datetime
 from typing import List, Dict, Optional
+import bisect
 import logging
 
 from src.common.schema import RiskEvent, ConfidenceBreakdown, FinalityTier
@@ -22,6 +23,10 @@ from src.common.config import config
 
 logger = logging.getLogger(__name__)
 
+# TCS status bands: _TCS_LABELS[i] applies below _TCS_THRESHOLDS[i]
+_TCS_THRESHOLDS = (0.4, 0.6, 0.8, 0.9)
+_TCS_LABELS = ("POOR", "LOW", "MODERATE", "GOOD", "EXCELLENT")
+
 
 class TCSCalculator:
     """
@@ -38,6 +43,11 @@ class TCSCalculator:
         self.source_importance = self.tcs_config["source_importance"]
         self.staleness_thresholds = self.tcs_config["staleness_thresholds"]
 
+        # Hot-path constants (avoid dict lookups per call)
+        self._fresh_sec = float(self.staleness_thresholds["fresh"])
+        self._acceptable_sec = float(self.staleness_thresholds["acceptable"])
+        self._attestation_threshold = self.tcs_config["attestation_threshold"]
+
     def calculate_tcs(
         self,
         events: List[RiskEvent],
@@ -106,14 +116,15 @@ class TCSCalculator:
 
         weighted_sum = 0.0
         total_importance = 0.0
+        importance_get = self.source_importance.get
+        infer_source_type = self._infer_source_type
 
         for event in events:
             # Get finality confidence for this event
             finality_conf = event.get_confidence_tier_value()
 
             # Get importance weight for this source
-            source_type = self._infer_source_type(event)
-            importance = self.source_importance.get(source_type, 1.0)
+            importance = importance_get(infer_source_type(event), 1.0)
 
             weighted_sum += finality_conf * importance
             total_importance += importance
@@ -137,18 +148,15 @@ class TCSCalculator:
 
         # Group events by chain and find min finality per chain
         chain_finalities: Dict[str, float] = {}
+        get_finality = chain_finalities.get
 
         for event in events:
             finality_conf = event.get_confidence_tier_value()
+            current = get_finality(event.chain)
 
-            if event.chain not in chain_finalities:
+            # Take minimum finality for this chain
+            if current is None or finality_conf < current:
                 chain_finalities[event.chain] = finality_conf
-            else:
-                # Take minimum finality for this chain
-                chain_finalities[event.chain] = min(
-                    chain_finalities[event.chain],
-                    finality_conf
-                )
 
         if not chain_finalities:
             return 0.0
@@ -169,8 +177,9 @@ class TCSCalculator:
 
         # Identify which source types are present
         present_sources = set()
+        infer_source_type = self._infer_source_type
         for event in events:
-            source_type = self._infer_source_type(event)
+            source_type = infer_source_type(event)
             if source_type:
                 present_sources.add(source_type)
 
@@ -198,15 +207,14 @@ class TCSCalculator:
         if not events:
             return 1.0
 
-        # Find oldest event
-        oldest_event = min(events, key=lambda e: e.timestamp)
-        age_sec = (reference_time - oldest_event.timestamp).total_seconds()
+        # Find oldest event timestamp
+        oldest_timestamp = min(e.timestamp for e in events)
+        age_sec = (reference_time - oldest_timestamp).total_seconds()
 
         # Apply tiered penalties
-        thresholds = self.staleness_thresholds
-        if age_sec < thresholds["fresh"]:
+        if age_sec < self._fresh_sec:
             return 1.0
-        elif age_sec < thresholds["acceptable"]:
+        elif age_sec < self._acceptable_sec:
             return 0.9
         else:
             return 0.7
@@ -241,17 +249,49 @@ class TCSCalculator:
         - completeness = 1/5 (only 1 source present)
         - staleness_penalty = based on event age
         """
-        breakdown = self.calculate_tcs([event])
+        self.update_event_tcs_batch([event])
+        return event
+
+    def update_event_tcs_batch(self, events: List[RiskEvent]) -> List[RiskEvent]:
+        """
+        Calculate and update single-event TCS for each event in a batch.
 
-        event.temporal_confidence = breakdown.temporal_confidence
-        event.confidence_breakdown = {
-            "finality_weight": breakdown.finality_weight,
-            "chain_confidence": breakdown.chain_confidence,
-            "completeness": breakdown.completeness,
-            "staleness_penalty": breakdown.staleness_penalty
-        }
+        Same per-event result as update_event_tcs, computed inline rather
+        than through calculate_tcs([event]); the clock, thresholds and
+        per-source completeness are resolved once for the whole batch.
+        """
+        now = datetime.utcnow()
+        fresh_sec = self._fresh_sec
+        acceptable_sec = self._acceptable_sec
+        source_completeness = 1.0 / len(self.expected_sources)
+        infer_source_type = self._infer_source_type
 
-        return event
+        for event in events:
+            finality = event.get_confidence_tier_value()
+
+            # Completeness: the one source this event contributes (if identifiable)
+            completeness = source_completeness if infer_source_type(event) else 0.0
+
+            # Staleness: tiered penalty on this event's age
+            age_sec = (now - event.timestamp).total_seconds()
+            if age_sec < fresh_sec:
+                staleness_penalty = 1.0
+            elif age_sec < acceptable_sec:
+                staleness_penalty = 0.9
+            else:
+                staleness_penalty = 0.7
+
+            temporal_confidence = (finality * finality * completeness) / staleness_penalty
+
+            event.temporal_confidence = max(0.0, min(1.0, temporal_confidence))
+            event.confidence_breakdown = {
+                "finality_weight": finality,
+                "chain_confidence": finality,
+                "completeness": completeness,
+                "staleness_penalty": staleness_penalty
+            }
+
+        return events
 
     def should_attest(self, tcs: float) -> bool:
         """
@@ -259,20 +299,11 @@ class TCSCalculator:
 
         Only high-confidence (tier2+) events are attested to save gas.
         """
-        return tcs >= self.tcs_config["attestation_threshold"]
+        return tcs >= self._attestation_threshold
 
     def get_tcs_status(self, tcs: float) -> str:
         """Get human-readable status for TCS value."""
-        if tcs >= 0.9:
-            return "EXCELLENT"
-        elif tcs >= 0.8:
-            return "GOOD"
-        elif tcs >= 0.6:
-            return "MODERATE"
-        elif tcs >= 0.4:
-            return "LOW"
-        else:
-            return "POOR"
+        return _TCS_LABELS[bisect.bisect_right(_TCS_THRESHOLDS, tcs)]
 
 
 # Singleton calculator
@@ -14,11 +14,12 @@ Runs all sources in parallel and emits unified RiskEvents.
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import List, Dict, AsyncIterator
+from typing import List, Dict, AsyncIterator, Optional
 from collections import defaultdict
 
 from src.common.config import Config
 from src.common.schema import RiskEvent
+from src.common.http_session import close_session
 from src.data_collection.sources.price_source import price_source
 from src.data_collection.sources.liquidity_source import liquidity_source
 from src.data_collection.sources.supply_source import MultiChainSupplyMonitor
@@ -29,6 +30,13 @@ from src.data_collection.quality.pipeline import DataQualityPipeline
 logger = logging.getLogger(__name__)
 
 
+def fmt_money(value: Optional[float], spec: str = ".6f") -> str:
+    """Format a USD amount for display, or "N/A" when missing."""
+    if value is None:
+        return "N/A"
+    return f"${value:{spec}}"
+
+
 class DataCollectionOrchestrator:
     """
     Orchestrates all data collection sources across multiple chains and coins.
@@ -90,16 +98,21 @@ class DataCollectionOrchestrator:
         """
         events = []
 
-        # Collect from each source in parallel
+        # Collect from each I/O-bound source in parallel
         tasks = [
             price_source.fetch_price(coin, chain),
             liquidity_source.fetch_liquidity(coin, chain),
-            volatility_source.calculate_volatility(coin, chain),
             sentiment_source.fetch_sentiment(coin, chain)
         ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
+        # Volatility is computed locally (no I/O), so call it directly
+        try:
+            results.append(volatility_source.calculate_volatility(coin, chain))
+        except Exception as e:
+            results.append(e)
+
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"Source failed for {coin} on {chain}: {result}")
@@ -127,18 +140,19 @@ class DataCollectionOrchestrator:
 
         all_events = []
 
-        # Collect for each coin/chain combination
-        for coin in self.coins:
-            for chain in self.chains:
-                logger.info(f"\n📊 Fetching {coin} on {chain}...")
-
-                events = await self.collect_all_sources_once(coin, chain)
+        # Collect every coin/chain combination concurrently, so a round takes
+        # as long as the slowest pair rather than the sum of all pairs
+        pairs = [(coin, chain) for coin in self.coins for chain in self.chains]
+        results = await asyncio.gather(
+            *(self.collect_all_sources_once(coin, chain) for coin, chain in pairs)
+        )
 
-                if events:
-                    logger.info(f"  ✓ Collected {len(events)} events from {len(events)} sources")
-                    all_events.extend(events)
-                else:
-                    logger.warning(f"  ⚠️ No data collected for {coin} on {chain}")
+        for (coin, chain), events in zip(pairs, results):
+            if events:
+                logger.info(f"  ✓ {coin} on {chain}: collected {len(events)} events")
+                all_events.extend(events)
+            else:
+                logger.warning(f"  ⚠️ No data collected for {coin} on {chain}")
 
         # Apply quality pipeline if enabled
         if self.quality_pipeline and all_events:
@@ -278,13 +292,13 @@ class DataCollectionOrchestrator:
             logger.info(f"\nAverage prices:")
             for key, price in summary["avg_price"].items():
                 if price:
-                    logger.info(f"  {key}: ${price:.6f}")
+                    logger.info(f"  {key}: {fmt_money(price)}")
 
         if summary["avg_liquidity"]:
             logger.info(f"\nAverage liquidity:")
             for key, liq in summary["avg_liquidity"].items():
                 if liq:
-                    logger.info(f"  {key}: ${liq:,.2f}")
+                    logger.info(f"  {key}: {fmt_money(liq, ',.2f')}")
 
         if summary["supply_changes"]:
             logger.info(f"\nNet supply changes:")
@@ -319,12 +333,14 @@ async def demo_orchestrator():
     async for event in orchestrator.stream_all_sources(poll_interval=5):
         logger.info(
             f"  Stream event {iteration}: {event.coin} on {event.chain} "
-            f"from {event.source} - price: ${event.price:.6f if event.price else 'N/A'}"
+            f"from {event.source} - price: {fmt_money(event.price)}"
         )
         iteration += 1
         if iteration >= 8:  # 2 iterations * 4 sources = 8 events
             break
 
+    await close_session()
+
     logger.info("\n" + "=" * 70)
     logger.info("✅ DEMO COMPLETE")
     logger.info("=" * 70)
@@ -336,4 +352,6 @@ if __name__ == "__main__":
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
 
-    asyncio.run(demo_orchestrator())
+    from src.common.event_loop import event_loop_factory
+
+    asyncio.run(demo_orchestrator(), loop_factory=event_loop_factory())
@@ -14,6 +14,7 @@ from collections import defaultdict
 import statistics
 import logging
 import asyncio
+import sys
 
 from src.common.schema import RiskEvent
 from src.common.config import config
@@ -85,11 +86,11 @@ class DataQualityPipeline:
         normalized = []
 
         for event in events:
-            # Normalize coin symbol
-            event.coin = event.coin.upper() if event.coin else ""
+            # Normalize coin symbol (interned: upper() always builds a new string)
+            event.coin = sys.intern(event.coin.upper()) if event.coin else ""
 
             # Normalize chain name
-            event.chain = event.chain.lower() if event.chain else ""
+            event.chain = sys.intern(event.chain.lower()) if event.chain else ""
 
             # Normalize price (clamp to bounds for stablecoins)
             if event.price is not None:
@@ -191,7 +192,7 @@ class DataQualityPipeline:
         # Price outliers
         prices = [e.price for e in events if e.price is not None]
         if len(prices) >= 3:
-            mean_price = statistics.mean(prices)
+            mean_price = statistics.fmean(prices)
             stdev_price = statistics.stdev(prices)
 
             if stdev_price > 0:
@@ -209,7 +210,7 @@ class DataQualityPipeline:
         # Liquidity outliers
         liquidities = [e.liquidity_depth for e in events if e.liquidity_depth is not None]
         if len(liquidities) >= 3:
-            mean_liq = statistics.mean(liquidities)
+            mean_liq = statistics.fmean(liquidities)
             stdev_liq = statistics.stdev(liquidities)
 
             if stdev_liq > 0:
@@ -8,7 +8,9 @@ from datetime import datetime
 from typing import Optional, List, Dict
 import aiohttp
 import logging
+import random
 
+from src.common.http_session import get_session
 from src.common.schema import RiskEvent
 from src.common.config import config
 from src.data_collection.quality.pipeline import backpressure_handler
@@ -102,14 +104,14 @@ class LiquiditySource:
             "poolAddress": pool_address.lower()
         }
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.subgraph_url,
-                json={"query": query, "variables": variables},
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+        session = await get_session()
+        async with session.post(
+            self.subgraph_url,
+            json={"query": query, "variables": variables},
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
 
         # Parse response
         if "errors" in data:
@@ -179,11 +181,10 @@ class MockLiquiditySource:
     async def fetch_liquidity(
         self,
         coin: str,
-        chain: str = "ethereum"
+        chain: str = "ethereum",
+        timestamp: Optional[datetime] = None
     ) -> Optional[RiskEvent]:
-        """Fetch mock liquidity data."""
-        import random
-
+        """Fetch mock liquidity data (timestamp defaults to now)."""
         base_tvl = self.typical_tvl.get(coin, 50_000_000)
 
         # Add ±10% variance
@@ -193,7 +194,7 @@ class MockLiquiditySource:
         volume = tvl * random.uniform(0.05, 0.10)
 
         event = RiskEvent(
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp or datetime.utcnow(),
             coin=coin,
             chain=chain,
             source="uniswap_v3_mock",
@@ -213,8 +214,9 @@ class MockLiquiditySource:
     ) -> List[RiskEvent]:
         """Fetch mock liquidity for multiple coins."""
         events = []
+        now = datetime.utcnow()  # One reference time for the whole batch
         for coin in coins:
-            event = await self.fetch_liquidity(coin, chain)
+            event = await self.fetch_liquidity(coin, chain, now)
             if event:
                 events.append(event)
         return events
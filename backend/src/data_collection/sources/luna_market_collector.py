@@ -13,16 +13,61 @@ Primary source: Binance API (historical klines and metrics)
 import asyncio
 import aiohttp
 import logging
+import yarl
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Optional
+import itertools
 import json
+import random
+import time
+from operator import itemgetter
 from pathlib import Path
+import pandas as pd
 
 from src.data_collection.sources.luna_crash_config import luna_config
 from src.common.schema import RiskEvent
 
 logger = logging.getLogger(__name__)
 
+# Binance kline pagination: 1000 bars per request at 5 minute bars
+KLINE_INTERVAL = "5m"
+KLINE_INTERVAL_MS = 5 * 60 * 1000
+KLINE_LIMIT = 1000
+
+# Concurrent kline page requests per symbol
+KLINE_CONCURRENCY = 8
+
+# Request rate budget (token bucket). A 1000-bar klines request costs
+# weight 5 against Binance's 6000/min, so 10 req/s leaves headroom.
+BINANCE_REQUESTS_PER_SEC = 10.0
+BINANCE_REQUEST_BURST = 20
+
+# Retries for rate-limited (429/418), 5xx and network failures
+KLINE_MAX_ATTEMPTS = 5
+
+# Market data export columns (CSV/Parquet)
+MARKET_COLUMNS = [
+    "timestamp",
+    "symbol",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume_usdt",
+    "num_trades",
+    "buy_pressure",
+    "price_change_pct"
+]
+
+# Symbols collected concurrently (all hit api.binance.com)
+SYMBOL_CONCURRENCY = 4
+
+
+def _write_json(path: Path, data) -> None:
+    """Write data as JSON (run in a worker thread)."""
+    with open(path, 'w') as f:
+        json.dump(data, f)
+
 
 class LunaMarketCollector:
     """Collects market metrics from exchanges during Luna crash."""
@@ -32,11 +77,64 @@ class LunaMarketCollector:
 
         # Binance API
         self.binance_url = "https://api.binance.com/api/v3"
+        # Parsed once; reused by every paginated request
+        self.klines_url = yarl.URL(f"{self.binance_url}/klines")
 
         # Ensure output directory exists
         self.output_dir = Path(self.config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Keep-alive session shared by all paginated requests
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Rate limiting (token bucket shared by all concurrent requests)
+        self.rate_limit_tokens = float(BINANCE_REQUEST_BURST)
+        self.last_refill_time = time.monotonic()
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the collector's HTTP session, opening it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.http_max_connections,
+                    limit_per_host=self.config.http_max_connections_per_host,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75
+                )
+            )
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _wait_for_rate_limit(self):
+        """Wait for a request token (token bucket algorithm)."""
+        while True:
+            # Refill tokens based on time elapsed
+            now = time.monotonic()
+            self.rate_limit_tokens = min(
+                BINANCE_REQUEST_BURST,
+                self.rate_limit_tokens + (now - self.last_refill_time) * BINANCE_REQUESTS_PER_SEC
+            )
+            self.last_refill_time = now
+
+            if self.rate_limit_tokens >= 1:
+                self.rate_limit_tokens -= 1
+                return
+
+            # Sleep until the next token is due, then re-check (other
+            # requests may have taken it meanwhile)
+            await asyncio.sleep((1 - self.rate_limit_tokens) / BINANCE_REQUESTS_PER_SEC)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
     async def fetch_klines(
         self,
         symbol: str,
@@ -53,14 +151,18 @@ class LunaMarketCollector:
             start_time: Start timestamp (ms)
             end_time: End timestamp (ms)
 
+        Rate limiting (429/418, honoring Retry-After), server errors and
+        network errors are retried with exponential backoff.
+
         Returns:
             List of klines [timestamp, open, high, low, close, volume, ...]
+            (empty if the request failed after all retries)
         """
-        url = f"{self.binance_url}/klines"
+        url = self.klines_url
         params = {
             "symbol": symbol,
             "interval": interval,
-            "limit": 1000  # Max per request
+            "limit": KLINE_LIMIT  # Max per request
         }
 
         if start_time:
@@ -68,27 +170,57 @@ class LunaMarketCollector:
         if end_time:
             params["endTime"] = end_time
 
-        try:
-            async with aiohttp.ClientSession() as session:
+        for attempt in range(KLINE_MAX_ATTEMPTS):
+            backoff = 0.5 * 2 ** attempt + random.random()
+
+            try:
+                await self._wait_for_rate_limit()
+                session = await self._get_session()
                 async with session.get(url, params=params) as response:
                     if response.status == 200:
                         data = await response.json()
                         return data
-                    else:
+
+                    if response.status in (429, 418):
+                        # Rate limited (418 = IP ban after ignoring 429s)
+                        retry_after = response.headers.get("Retry-After")
+                        if retry_after and retry_after.isdigit():
+                            backoff = int(retry_after)
+                    elif response.status < 500:
                         logger.warning(
                             f"Binance API error for {symbol}: {response.status}"
                         )
                         return []
-        except Exception as e:
-            logger.error(f"Error fetching klines for {symbol}: {e}")
-            return []
+
+                    logger.warning(
+                        f"Binance API error for {symbol}: {response.status} "
+                        f"(attempt {attempt + 1}/{KLINE_MAX_ATTEMPTS})"
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.warning(
+                    f"Error fetching klines for {symbol}: {e} "
+                    f"(attempt {attempt + 1}/{KLINE_MAX_ATTEMPTS})"
+                )
+            except Exception as e:
+                logger.error(f"Error fetching klines for {symbol}: {e}")
+                return []
+
+            if attempt + 1 < KLINE_MAX_ATTEMPTS:
+                await asyncio.sleep(backoff)
+
+        logger.error(
+            f"Giving up on klines for {symbol} after {KLINE_MAX_ATTEMPTS} attempts"
+        )
+        return []
 
     async def fetch_all_klines(self, symbol: str) -> List[List]:
         """
         Fetch all klines for the crash period (May 2-13, 2022).
 
         Binance klines endpoint has a 1000 record limit, so we need to
-        paginate through the time range.
+        paginate through the time range. Bars are a fixed 5 minutes wide,
+        so page boundaries are known up front and pages are fetched
+        concurrently (bounded by KLINE_CONCURRENCY).
 
         Args:
             symbol: Trading pair
@@ -96,39 +228,42 @@ class LunaMarketCollector:
         Returns:
             All klines for the period
         """
-        all_klines = []
-
         # Convert config dates to milliseconds
         start_ms = int(self.config.start_date.timestamp() * 1000)
         end_ms = int(self.config.end_date.timestamp() * 1000)
 
-        # Fetch in chunks (Binance limit: 1000 records per request)
-        # 5min intervals: 1000 * 5 = 5000 mins = ~3.5 days
-        # We need to loop until we reach end_ms
-        
-        current_start = start_ms
-        while current_start < end_ms:
-            logger.info(f"  Fetching from {datetime.fromtimestamp(current_start/1000, tz=timezone.utc)}...")
-            
-            chunk = await self.fetch_klines(
-                symbol=symbol,
-                interval="5m",
-                start_time=current_start,
-                end_time=end_ms
-            )
-            
-            if not chunk:
-                break
-                
-            all_klines.extend(chunk)
-            
-            # Start next chunk from the last close time + 1ms
-            # kline[6] is close time (ms)
-            last_close_time = chunk[-1][6]
-            current_start = last_close_time + 1
-            
-            # Rate limiting
-            await asyncio.sleep(0.1)
+        # One page per 1000 bars: 1000 * 5 = 5000 mins = ~3.5 days.
+        # endTime is inclusive, so pages end 1ms before the next starts.
+        page_ms = KLINE_LIMIT * KLINE_INTERVAL_MS
+        pages = [
+            (page_start, min(page_start + page_ms - 1, end_ms))
+            for page_start in range(start_ms, end_ms, page_ms)
+        ]
+
+        semaphore = asyncio.Semaphore(KLINE_CONCURRENCY)
+
+        async def fetch_page(page_start: int, page_end: int) -> List[List]:
+            async with semaphore:
+                logger.info(f"  Fetching from {datetime.fromtimestamp(page_start/1000, tz=timezone.utc)}...")
+                return await self.fetch_klines(
+                    symbol=symbol,
+                    interval=KLINE_INTERVAL,
+                    start_time=page_start,
+                    end_time=page_end
+                )
+
+        chunks = await asyncio.gather(*(fetch_page(*page) for page in pages))
+
+        # Drop any bar seen twice (e.g. a retried page overlapping its
+        # neighbour), then put them in time order (kline[0] is open time)
+        seen_open_times = set()
+        all_klines = []
+        for kline in itertools.chain.from_iterable(chunks):
+            open_time = kline[0]
+            if open_time not in seen_open_times:
+                seen_open_times.add(open_time)
+                all_klines.append(kline)
+        all_klines.sort(key=itemgetter(0))
 
         logger.info(f"✓ Fetched {len(all_klines)} klines for {symbol}")
 
@@ -214,6 +349,40 @@ class LunaMarketCollector:
 
         return events
 
+    def parse_klines_to_frame(self, symbol: str, klines: List[List]) -> pd.DataFrame:
+        """
+        Convert Binance klines straight to MARKET_COLUMNS rows.
+
+        Same values as parse_klines_to_events, computed column-wise without
+        building a RiskEvent per bar (for CSV/Parquet export and stats).
+
+        Args:
+            symbol: Trading pair (e.g., "LUNAUSDT")
+            klines: List of kline arrays
+
+        Returns:
+            DataFrame with MARKET_COLUMNS
+        """
+        raw = pd.DataFrame(klines)
+        open_price = raw[1].astype(float)
+        close_price = raw[4].astype(float)
+        volume = raw[5].astype(float)
+        taker_buy_volume = raw[9].astype(float)
+
+        return pd.DataFrame({
+            "timestamp": pd.to_datetime(raw[0], unit="ms", utc=True),
+            "symbol": symbol,
+            "open": open_price,
+            "high": raw[2].astype(float),
+            "low": raw[3].astype(float),
+            "close": close_price,
+            "volume_usdt": raw[7].astype(float),
+            "num_trades": raw[8].astype(int),
+            "buy_pressure": (taker_buy_volume / volume).where(volume > 0, 0.5),
+            "price_change_pct": ((close_price - open_price) / open_price * 100)
+            .where(open_price > 0, 0.0)
+        }, columns=MARKET_COLUMNS)
+
     async def collect_all_market_data(self) -> Dict[str, List[RiskEvent]]:
         """
         Collect market data for all configured symbols.
@@ -221,122 +390,160 @@ class LunaMarketCollector:
         Returns:
             Dict mapping symbol to list of RiskEvents
         """
-        logger.info("=" * 70)
-        logger.info("COLLECTING LUNA CRASH MARKET DATA (BINANCE)")
-        logger.info("=" * 70)
-
         all_events = {}
+        for symbol, klines in (await self.fetch_all_symbols()).items():
+            all_events[symbol] = self.parse_klines_to_events(symbol, klines)
+            logger.info(f"✓ Parsed {len(all_events[symbol])} events from {symbol}")
 
-        for symbol in self.config.binance_symbols:
-            logger.info(f"\nFetching {symbol}...")
+        return all_events
 
-            # Fetch klines
-            klines = await self.fetch_all_klines(symbol)
+    async def collect_market_frame(self) -> pd.DataFrame:
+        """
+        Collect market data for all configured symbols as one DataFrame.
 
-            if klines:
-                # Convert to events
-                events = self.parse_klines_to_events(symbol, klines)
-                all_events[symbol] = events
+        Skips RiskEvent construction; use when the data is only exported.
 
-                # Save raw klines
-                output_file = self.output_dir / f"{symbol.lower()}_klines.json"
-                with open(output_file, 'w') as f:
-                    json.dump(klines, f)
+        Returns:
+            DataFrame with MARKET_COLUMNS (symbols in config order)
+        """
+        frames = [
+            self.parse_klines_to_frame(symbol, klines)
+            for symbol, klines in (await self.fetch_all_symbols()).items()
+        ]
 
-                logger.info(f"✓ Parsed {len(events)} events from {symbol}")
+        if not frames:
+            return pd.DataFrame(columns=MARKET_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
 
-            # Rate limiting (Binance: 1200 req/min)
-            await asyncio.sleep(0.1)
+    async def fetch_all_symbols(self) -> Dict[str, List[List]]:
+        """
+        Fetch (and save) raw klines for all configured symbols.
 
-        logger.info("\n" + "=" * 70)
-        logger.info(f"COLLECTION COMPLETE: {len(all_events)} symbols")
+        Returns:
+            Dict mapping symbol to its klines (symbols with no data omitted)
+        """
+        logger.info("=" * 70)
+        logger.info("COLLECTING LUNA CRASH MARKET DATA (BINANCE)")
         logger.info("=" * 70)
 
-        return all_events
+        # Symbols are independent; bound fan-out to stay under Binance's
+        # request weight limit (1200 req/min)
+        semaphore = asyncio.Semaphore(SYMBOL_CONCURRENCY)
+        results = await asyncio.gather(*(
+            self._fetch_symbol(symbol, semaphore)
+            for symbol in self.config.binance_symbols
+        ))
+
+        all_klines = {
+            symbol: klines
+            for symbol, klines in zip(self.config.binance_symbols, results)
+            if klines
+        }
 
-    async def save_market_data_csv(self, all_events: Dict[str, List[RiskEvent]]):
-        """Save market data to CSV."""
-        import csv
+        logger.info("\n" + "=" * 70)
+        logger.info(f"COLLECTION COMPLETE: {len(all_klines)} symbols")
+        logger.info("=" * 70)
 
-        output_file = self.output_dir / "luna_crash_market.csv"
+        return all_klines
+
+    async def _fetch_symbol(
+        self,
+        symbol: str,
+        semaphore: asyncio.Semaphore
+    ) -> List[List]:
+        """Fetch and save klines for one symbol."""
+        async with semaphore:
+            logger.info(f"\nFetching {symbol}...")
 
-        with open(output_file, 'w', newline='') as f:
-            writer = csv.writer(f)
-
-            # Header
-            writer.writerow([
-                "timestamp",
-                "symbol",
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume_usdt",
-                "num_trades",
-                "buy_pressure",
-                "price_change_pct"
-            ])
-
-            for symbol, events in all_events.items():
-                for event in events:
-                    meta = event.metadata or {}
-                    writer.writerow([
-                        event.timestamp.isoformat(),
-                        symbol,
-                        meta.get('open'),
-                        meta.get('high'),
-                        meta.get('low'),
-                        event.price,
-                        event.volume,
-                        meta.get('num_trades'),
-                        meta.get('buy_pressure'),
-                        meta.get('price_change_pct')
-                    ])
+            # Fetch klines
+            klines = await self.fetch_all_klines(symbol)
 
+        if klines:
+            # Save raw klines without blocking the other symbols' fetches
+            output_file = self.output_dir / f"{symbol.lower()}_klines.json"
+            await asyncio.to_thread(_write_json, output_file, klines)
+
+        return klines
+
+    def market_events_to_frame(self, all_events: Dict[str, List[RiskEvent]]) -> pd.DataFrame:
+        """Lay market events out column-wise (one list per field) as a DataFrame."""
+        columns = {name: [] for name in MARKET_COLUMNS}
+
+        for symbol, events in all_events.items():
+            for event in events:
+                meta = event.metadata or {}
+                columns["timestamp"].append(event.timestamp)
+                columns["symbol"].append(symbol)
+                columns["open"].append(meta.get('open'))
+                columns["high"].append(meta.get('high'))
+                columns["low"].append(meta.get('low'))
+                columns["close"].append(event.price)
+                columns["volume_usdt"].append(event.volume)
+                columns["num_trades"].append(meta.get('num_trades'))
+                columns["buy_pressure"].append(meta.get('buy_pressure'))
+                columns["price_change_pct"].append(meta.get('price_change_pct'))
+
+        return pd.DataFrame(columns)
+
+    async def save_market_data_csv(self, all_events: Dict[str, List[RiskEvent]]) -> pd.DataFrame:
+        """Save market data to CSV, plus Parquet for faster loading (returns the frame)."""
+        df = self.market_events_to_frame(all_events)
+        await self.save_market_frame(df)
+        return df
+
+    async def save_market_frame(self, df: pd.DataFrame):
+        """Save a MARKET_COLUMNS frame to CSV and Parquet."""
+        output_file = self.output_dir / "luna_crash_market.csv"
+        # Serialise off the event loop so concurrent fetches keep running
+        await asyncio.to_thread(df.to_csv, output_file, index=False)
         logger.info(f"✓ Saved market data to {output_file}")
 
+        parquet_file = self.output_dir / "luna_crash_market.parquet"
+        await asyncio.to_thread(df.to_parquet, parquet_file, index=False, compression="zstd")
+        logger.info(f"✓ Saved parquet format to {parquet_file}")
+
 
 async def demo_luna_market_collection():
     """Demo: Collect Luna crash market data."""
-    collector = LunaMarketCollector()
-
-    # Collect data
-    all_events = await collector.collect_all_market_data()
+    async with LunaMarketCollector() as collector:
+        # Collect data (columnar; the demo never needs RiskEvents)
+        df = await collector.collect_market_frame()
 
-    # Save to CSV
-    await collector.save_market_data_csv(all_events)
+        # Save to CSV
+        await collector.save_market_frame(df)
 
     # Print statistics
     logger.info("\n" + "=" * 70)
     logger.info("MARKET DATA STATISTICS")
     logger.info("=" * 70)
 
-    for symbol, events in all_events.items():
-        if events:
-            first = events[0]
-            last = events[-1]
-
-            price_change = (last.price - first.price) / first.price * 100
-
-            total_volume = sum(e.volume or 0 for e in events)
-            avg_buy_pressure = sum(
-                e.metadata.get('buy_pressure', 0.5) for e in events
-            ) / len(events)
-
-            logger.info(f"\n{symbol}:")
-            logger.info(f"  Data points:     {len(events)}")
-            logger.info(f"  Price change:    {price_change:+.1f}%")
-            logger.info(
-                f"  First price:     ${first.price:.8f} "
-                f"({first.timestamp.strftime('%Y-%m-%d %H:%M')})"
-            )
-            logger.info(
-                f"  Last price:      ${last.price:.8f} "
-                f"({last.timestamp.strftime('%Y-%m-%d %H:%M')})"
-            )
-            logger.info(f"  Total volume:    ${total_volume/1e9:.2f}B")
-            logger.info(f"  Avg buy pressure: {avg_buy_pressure:.1%}")
+    # One grouped pass over the columnar frame (rows are in time order)
+    stats = df.groupby("symbol", sort=False).agg(
+        data_points=("close", "size"),
+        first_price=("close", "first"),
+        last_price=("close", "last"),
+        first_time=("timestamp", "first"),
+        last_time=("timestamp", "last"),
+        total_volume=("volume_usdt", "sum"),
+        avg_buy_pressure=("buy_pressure", "mean")
+    )
 
+    for symbol, row in stats.iterrows():
+        price_change = (row.last_price - row.first_price) / row.first_price * 100
+
+        logger.info(f"\n{symbol}:")
+        logger.info(f"  Data points:     {row.data_points}")
+        logger.info(f"  Price change:    {price_change:+.1f}%")
+        logger.info(
+            f"  First price:     ${row.first_price:.8f} "
+            f"({row.first_time.strftime('%Y-%m-%d %H:%M')})"
+        )
+        logger.info(
+            f"  Last price:      ${row.last_price:.8f} "
+            f"({row.last_time.strftime('%Y-%m-%d %H:%M')})"
+        )
+        logger.info(f"  Total volume:    ${row.total_volume/1e9:.2f}B")
+        logger.info(f"  Avg buy pressure: {row.avg_buy_pressure:.1%}")
 
 if __name__ == "__main__":
     logging.basicConfig(
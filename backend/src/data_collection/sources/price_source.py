@@ -8,7 +8,9 @@ from datetime import datetime
 from typing import Optional, List
 import aiohttp
 import logging
+import random
 
+from src.common.http_session import get_session
 from src.common.schema import RiskEvent
 from src.common.config import config
 from src.data_collection.quality.pipeline import backpressure_handler
@@ -96,15 +98,15 @@ class PriceSource:
         if self.api_key:
             headers["x-cg-pro-api-key"] = self.api_key
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url,
-                params=params,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=self.timeout)
-            ) as response:
-                response.raise_for_status()
-                data = await response.json()
+        session = await get_session()
+        async with session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        ) as response:
+            response.raise_for_status()
+            data = await response.json()
 
         # Parse response
         coin_data = data.get(coin_id, {})
@@ -166,17 +168,18 @@ class PriceSource:
             if self.api_key:
                 headers["x-cg-pro-api-key"] = self.api_key
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    url,
-                    params=params,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout)
-                ) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-            # Parse responses
+            session = await get_session()
+            async with session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+
+            # Parse responses (one fallback time for coins without last_updated)
+            now = datetime.utcnow()
             for coin in coins:
                 coin_id = self.coin_id_map.get(coin)
                 if not coin_id:
@@ -194,7 +197,7 @@ class PriceSource:
                     continue
 
                 event = RiskEvent(
-                    timestamp=datetime.utcfromtimestamp(last_updated) if last_updated else datetime.utcnow(),
+                    timestamp=datetime.utcfromtimestamp(last_updated) if last_updated else now,
                     coin=coin,
                     chain=chain,
                     source="coingecko",
@@ -231,11 +234,10 @@ class MockPriceSource:
     async def fetch_price(
         self,
         coin: str,
-        chain: str = "ethereum"
+        chain: str = "ethereum",
+        timestamp: Optional[datetime] = None
     ) -> Optional[RiskEvent]:
-        """Generate mock price data."""
-        import random
-        
+        """Generate mock price data (timestamp defaults to now)."""
         base_price = self.prices.get(coin, 1.0)
         
         # Add tiny random variation (±0.1%)
@@ -248,7 +250,7 @@ class MockPriceSource:
             logger.warning(f"[MOCK] Depeg event simulated for {coin}: ${price:.4f}")
             
         event = RiskEvent(
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp or datetime.utcnow(),
             coin=coin,
             chain=chain,
             source="coingecko_mock",
@@ -268,8 +270,9 @@ class MockPriceSource:
     ) -> List[RiskEvent]:
         """Generate mock prices for multiple coins."""
         events = []
+        now = datetime.utcnow()  # One reference time for the whole batch
         for coin in coins:
-            event = await self.fetch_price(coin, chain)
+            event = await self.fetch_price(coin, chain, now)
             if event:
                 events.append(event)
         return events
@@ -7,6 +7,7 @@ Analyzes Twitter/Reddit for sentiment signals.
 from datetime import datetime
 from typing import Optional, List, Dict
 import logging
+import random
 
 from src.common.schema import RiskEvent
 from src.common.config import config
@@ -79,11 +80,10 @@ class MockSentimentSource:
     async def fetch_sentiment(
         self,
         coin: str,
-        chain: str = "ethereum"
+        chain: str = "ethereum",
+        timestamp: Optional[datetime] = None
     ) -> Optional[RiskEvent]:
-        """Generate mock sentiment data."""
-        import random
-
+        """Generate mock sentiment data (timestamp defaults to now)."""
         base_sentiment = self.typical_sentiment.get(coin, 0.2)
 
         # Add random variation (-0.3 to +0.3)
@@ -98,7 +98,7 @@ class MockSentimentSource:
             logger.warning(f"[MOCK] Negative sentiment spike for {coin}!")
 
         event = RiskEvent(
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp or datetime.utcnow(),
             coin=coin,
             chain=chain,
             source="sentiment_mock",
@@ -126,8 +126,9 @@ class MockSentimentSource:
     ) -> List[RiskEvent]:
         """Generate mock sentiment for multiple coins."""
         events = []
+        now = datetime.utcnow()  # One reference time for the whole batch
         for coin in coins:
-            event = await self.fetch_sentiment(coin, chain)
+            event = await self.fetch_sentiment(coin, chain, now)
             if event:
                 events.append(event)
         return events
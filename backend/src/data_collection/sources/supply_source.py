@@ -156,8 +156,9 @@ class Web3SupplyMonitor:
 
             logs = self.w3.eth.get_logs(filter_params)
 
-            # Process logs into RiskEvents
+            # Process logs into RiskEvents, counting mints as they're built
             events = []
+            mint_count = 0
             for log in logs:
                 transfer = self.decode_transfer_event(log)
                 if not transfer:
@@ -177,6 +178,7 @@ class Web3SupplyMonitor:
 
                 # Calculate net supply change (positive for mint, negative for burn)
                 net_change = transfer['amount_decimal'] if is_mint else -transfer['amount_decimal']
+                mint_count += is_mint
 
                 event = RiskEvent(
                     timestamp=timestamp,
@@ -203,8 +205,7 @@ class Web3SupplyMonitor:
 
             logger.info(
                 f"✓ Found {len(events)} supply events "
-                f"({sum(1 for e in events if e.metadata['event_type'] == 'mint')} mints, "
-                f"{sum(1 for e in events if e.metadata['event_type'] == 'burn')} burns)"
+                f"({mint_count} mints, {len(events) - mint_count} burns)"
             )
 
             return events
@@ -8,6 +8,7 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Dict
 from collections import deque
 import statistics
+import random
 import logging
 
 from src.common.schema import RiskEvent
@@ -44,7 +45,8 @@ class VolatilityCalculator:
     def calculate_volatility(
         self,
         coin: str,
-        chain: str = "ethereum"
+        chain: str = "ethereum",
+        timestamp: Optional[datetime] = None
     ) -> Optional[RiskEvent]:
         """
         Calculate volatility for a coin based on recent price history.
@@ -52,6 +54,7 @@ class VolatilityCalculator:
         Args:
             coin: Stablecoin symbol
             chain: Blockchain name
+            timestamp: Event timestamp (default: now)
 
         Returns:
             RiskEvent with volatility metric, or None if insufficient data
@@ -61,27 +64,24 @@ class VolatilityCalculator:
             return None
 
         prices = [price for _, price in self.price_history[coin]]
+        n = len(prices)
 
-        if len(prices) < 2:
+        if n < 2:
             logger.debug(f"Insufficient price data for {coin} volatility (need ≥2 points)")
             return None
 
-        # Calculate standard deviation (volatility)
-        try:
-            volatility = statistics.stdev(prices)
-        except statistics.StatisticsError:
-            logger.warning(f"Could not calculate volatility for {coin}")
-            return None
+        # Calculate standard deviation (volatility), reusing the mean
+        mean_price = statistics.fmean(prices)
+        volatility = statistics.stdev(prices, mean_price)
 
         # Calculate additional metrics
-        mean_price = statistics.mean(prices)
         price_range = max(prices) - min(prices)
 
         # Relative volatility (coefficient of variation)
         relative_volatility = (volatility / mean_price) if mean_price > 0 else 0
 
         event = RiskEvent(
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp or datetime.utcnow(),
             coin=coin,
             chain=chain,
             source="volatility_calculator",
@@ -95,7 +95,7 @@ class VolatilityCalculator:
         logger.info(
             f"Calculated volatility for {coin}: "
             f"σ={volatility:.6f} ({relative_volatility*100:.4f}%), "
-            f"range=${price_range:.6f}, n={len(prices)}"
+            f"range=${price_range:.6f}, n={n}"
         )
 
         return event
@@ -107,9 +107,10 @@ class VolatilityCalculator:
     ) -> List[RiskEvent]:
         """Calculate volatility for multiple coins."""
         events = []
+        now = datetime.utcnow()  # One reference time for the whole batch
 
         for coin in coins:
-            event = self.calculate_volatility(coin, chain)
+            event = self.calculate_volatility(coin, chain, timestamp=now)
             if event:
                 events.append(event)
 
@@ -137,21 +138,56 @@ class MockVolatilitySource:
             "DAI": 0.0006,   # 0.06% daily volatility
         }
 
-    async def calculate_volatility(
+    def calculate_volatility(
         self,
         coin: str,
-        chain: str = "ethereum"
+        chain: str = "ethereum",
+        timestamp: Optional[datetime] = None
     ) -> Optional[RiskEvent]:
-        """Generate mock volatility data."""
-        import random
+        """
+        Generate mock volatility data.
+
+        Synchronous: generation is pure CPU work with no I/O to await.
+        """
+        return self._build_event(
+            coin, chain, random.uniform(-0.2, 0.2), timestamp or datetime.utcnow()
+        )
 
+    async def calculate_volatility_batch(
+        self,
+        coins: List[str],
+        chain: str = "ethereum"
+    ) -> List[RiskEvent]:
+        """
+        Generate mock volatility for multiple coins.
+
+        Kept async so callers can treat it like the other source batches.
+        """
+        # Draw all variations up front, then build events in one pass
+        uniform = random.uniform
+        variations = [uniform(-0.2, 0.2) for _ in coins]
+        now = datetime.utcnow()  # One reference time for the whole batch
+
+        return [
+            self._build_event(coin, chain, variation, now)
+            for coin, variation in zip(coins, variations)
+        ]
+
+    def _build_event(
+        self,
+        coin: str,
+        chain: str,
+        variation: float,
+        timestamp: datetime
+    ) -> RiskEvent:
+        """Build a mock volatility event with the given relative variation."""
         base_volatility = self.typical_volatility.get(coin, 0.0007)
 
         # Add some random variation (±20%)
-        volatility = base_volatility * (1.0 + random.uniform(-0.2, 0.2))
+        volatility = base_volatility * (1.0 + variation)
 
         event = RiskEvent(
-            timestamp=datetime.utcnow(),
+            timestamp=timestamp,
             coin=coin,
             chain=chain,
             source="volatility_mock",
@@ -163,19 +199,6 @@ class MockVolatilitySource:
         logger.info(f"[MOCK] Calculated volatility for {coin}: {volatility*100:.4f}%")
         return event
 
-    async def calculate_volatility_batch(
-        self,
-        coins: List[str],
-        chain: str = "ethereum"
-    ) -> List[RiskEvent]:
-        """Generate mock volatility for multiple coins."""
-        events = []
-        for coin in coins:
-            event = await self.calculate_volatility(coin, chain)
-            if event:
-                events.append(event)
-        return events
-
 
 # Create singleton instances
 volatility_calculator = VolatilityCalculator(window_size=24)
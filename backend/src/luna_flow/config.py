@@ -15,6 +15,7 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from pathlib import Path
 from dataclasses import dataclass
+from functools import cached_property
 
 # Local import
 # from src.common.schema import RiskEvent  # Removed external dependency if not needed here directly,
@@ -51,6 +52,11 @@ class LunaCrashConfig:
     # Binance API configuration
     binance_symbols: Optional[List[str]] = None
 
+    # HTTP connection pool per collector session (Binance traffic is all
+    # one host, so the per-host cap is the effective concurrency limit)
+    http_max_connections: int = 20
+    http_max_connections_per_host: int = 10
+
     # Output configuration
     output_dir: str = "/home/tba/projects/web3/data/luna_crash"
 
@@ -83,25 +89,35 @@ class LunaCrashConfig:
         if self.binance_symbols is None:
             self.binance_symbols = ["LUNAUSDT", "USTUSDT"]
 
+    @cached_property
+    def date_range_days(self) -> int:
+        """Number of days in collection period (computed once)."""
+        return (self.end_date - self.start_date).days + 1
+
+    @cached_property
+    def total_intervals(self) -> int:
+        """Total number of price collection intervals (computed once)."""
+        total_minutes = (self.end_date - self.start_date).total_seconds() / 60
+        return int(total_minutes / self.price_interval_minutes)
+
     def get_date_range_days(self) -> int:
         """Calculate number of days in collection period."""
-        return (self.end_date - self.start_date).days + 1
+        return self.date_range_days
 
     def get_total_intervals(self) -> int:
         """Calculate total number of price collection intervals."""
-        total_minutes = (self.end_date - self.start_date).total_seconds() / 60
-        return int(total_minutes / self.price_interval_minutes)
+        return self.total_intervals
 
     def to_dict(self) -> dict:
         """Export configuration as dictionary."""
         return {
             "start_date": self.start_date.isoformat(),
             "end_date": self.end_date.isoformat(),
-            "duration_days": self.get_date_range_days(),
+            "duration_days": self.date_range_days,
             "assets": self.assets,
             "price_interval_minutes": self.price_interval_minutes,
             "onchain_interval_minutes": self.onchain_interval_minutes,
-            "total_price_intervals": self.get_total_intervals(),
+            "total_price_intervals": self.total_intervals,
             "terra_chain_id": self.terra_chain_id,
             "terra_rpc_url": self.terra_rpc_url,
             "binance_symbols": self.binance_symbols,
@@ -57,19 +57,20 @@ class LunaDataAggregator:
         logger.info(f"Duration: {self.config.get_date_range_days()} days")
         logger.info("")
 
-        # Step 1: Collect price data
-        logger.info("STEP 1: Collecting price data from CoinGecko...")
-        price_raw = await self.price_collector.collect_all_prices()
+        # The three collectors hit independent APIs, so run them concurrently
+        logger.info("Collecting price (CoinGecko), on-chain supply (Terra) "
+                    "and market (Binance) data concurrently...")
+        try:
+            price_raw, onchain_events, market_events = await asyncio.gather(
+                self.price_collector.collect_all_prices(),
+                self.onchain_collector.collect_all_onchain_data(),
+                self.market_collector.collect_all_market_data()
+            )
+        finally:
+            await self.onchain_collector.close()
+            await self.market_collector.close()
         price_events = self.price_collector.convert_to_risk_events(price_raw)
 
-        # Step 2: Collect on-chain data
-        logger.info("\nSTEP 2: Collecting on-chain supply data...")
-        onchain_events = await self.onchain_collector.collect_all_onchain_data()
-
-        # Step 3: Collect market data
-        logger.info("\nSTEP 3: Collecting market data from Binance...")
-        market_events = await self.market_collector.collect_all_market_data()
-
         return {
             "price_raw": price_raw,
             "price_events": price_events,
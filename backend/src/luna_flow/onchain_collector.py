@@ -15,6 +15,7 @@ Note: Terra blockchain was halted on May 12, 2022. This collector uses:
 import asyncio
 import aiohttp
 import logging
+import yarl
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 import json
@@ -25,6 +26,43 @@ from .models import RiskEvent
 
 logger = logging.getLogger(__name__)
 
+# LCD tx search pagination (crash-era blocks can hold thousands of txs)
+TXS_PAGE_SIZE = 100
+TXS_MAX_PAGES = 50
+
+# Concurrent RPC requests when fetching a range of blocks
+BLOCK_FETCH_CONCURRENCY = 10
+
+# Known supply data points during crash (from Terra research)
+# Source: https://terra.smartstake.io/history
+KNOWN_SUPPLY = {
+    "uluna": {
+        "2022-05-07": 345_800_000,      # Pre-crash
+        "2022-05-08": 400_000_000,      # +15%
+        "2022-05-09": 1_200_000_000,    # +200% (hyperinflation begins)
+        "2022-05-10": 3_500_000_000,    # Death spiral
+        "2022-05-11": 6_500_000_000_000,  # 6.5 TRILLION (peak)
+        "2022-05-12": 6_900_000_000_000,  # Chain halted
+        "2022-05-13": 6_900_000_000_000,  # Post-halt (no minting)
+        "2022-05-14": 6_900_000_000_000,  # Post-halt
+    },
+    "uusd": {
+        "2022-05-07": 11_200_000_000,   # $11.2B UST in circulation
+        "2022-05-08": 10_500_000_000,   # Some burning
+        "2022-05-09": 9_800_000_000,    # Mass exit
+        "2022-05-10": 8_500_000_000,    # De-pegging
+        "2022-05-11": 6_000_000_000,    # Collapse
+        "2022-05-12": 4_500_000_000,    # Chain halted
+        "2022-05-13": 4_500_000_000,    # Post-halt
+        "2022-05-14": 4_500_000_000,    # Post-halt
+    }
+}
+
+
+def known_supply_at(timestamp: datetime, denom: str) -> Optional[int]:
+    """Look up the known daily supply of a denom (None if not recorded)."""
+    return KNOWN_SUPPLY.get(denom, {}).get(timestamp.date().isoformat())
+
 
 class LunaOnChainCollector:
     """Collects on-chain events from Terra Classic blockchain."""
@@ -36,6 +74,10 @@ class LunaOnChainCollector:
         self.rpc_url = self.config.terra_rpc_url
         self.lcd_url = "https://terra-classic-lcd.publicnode.com"
 
+        # Endpoint URLs, parsed once and reused per block request
+        self.block_url = yarl.URL(f"{self.rpc_url}/block")
+        self.txs_url = yarl.URL(f"{self.lcd_url}/cosmos/tx/v1beta1/txs")
+
         # Terra Finder (archived data source)
         self.fcd_url = "https://fcd.terra.dev"
 
@@ -47,6 +89,34 @@ class LunaOnChainCollector:
         self.output_dir = Path(self.config.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Keep-alive session shared by all RPC/LCD requests
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the collector's HTTP session, opening it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.http_max_connections,
+                    limit_per_host=self.config.http_max_connections_per_host,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=75
+                )
+            )
+        return self._session
+
+    async def close(self):
+        """Close the HTTP session and its pooled connections."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
     async def fetch_block_by_height(self, height: int) -> Optional[Dict]:
         """
         Fetch block data by height from Terra Classic RPC.
@@ -57,49 +127,98 @@ class LunaOnChainCollector:
         Returns:
             Block data dict
         """
-        url = f"{self.rpc_url}/block"
+        url = self.block_url
         params = {"height": height}
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get('result', {})
-                    else:
-                        logger.warning(f"Failed to fetch block {height}: {response.status}")
-                        return None
+            session = await self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return data.get('result', {})
+                else:
+                    logger.warning(f"Failed to fetch block {height}: {response.status}")
+                    return None
         except Exception as e:
             logger.error(f"Error fetching block {height}: {e}")
             return None
 
-    async def fetch_txs_by_height(self, height: int) -> List[Dict]:
+    async def fetch_blocks_range(
+        self,
+        start: int,
+        end: int,
+        concurrency: int = BLOCK_FETCH_CONCURRENCY
+    ) -> List[Optional[Dict]]:
+        """
+        Fetch blocks [start, end) concurrently from Terra Classic RPC.
+
+        Args:
+            start: First block height
+            end: Height after the last block
+            concurrency: Max requests in flight
+
+        Returns:
+            Block data dicts in height order (None for blocks that failed)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(height: int) -> Optional[Dict]:
+            async with semaphore:
+                return await self.fetch_block_by_height(height)
+
+        return await asyncio.gather(*(fetch_one(height) for height in range(start, end)))
+
+    async def fetch_txs_by_height(
+        self,
+        height: int,
+        page_size: int = TXS_PAGE_SIZE,
+        max_pages: int = TXS_MAX_PAGES
+    ) -> List[Dict]:
         """
         Fetch all transactions in a block.
 
+        Follows the LCD's pagination.next_key cursor until the block is
+        exhausted or max_pages is reached.
+
         Args:
             height: Block height
+            page_size: Transactions per request
+            max_pages: Upper bound on requests for one block
 
         Returns:
-            List of transaction dicts
+            List of transaction dicts (partial if a page fails)
         """
-        url = f"{self.lcd_url}/cosmos/tx/v1beta1/txs"
+        url = self.txs_url
         params = {
             "events": f"tx.height={height}",
-            "pagination.limit": 100
+            "pagination.limit": page_size
         }
+        txs = []
 
         try:
-            async with aiohttp.ClientSession() as session:
+            session = await self._get_session()
+            for _ in range(max_pages):
                 async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data.get('txs', [])
-                    else:
-                        return []
+                    if response.status != 200:
+                        logger.warning(
+                            f"Failed to fetch txs for block {height}: {response.status} "
+                            f"({len(txs)} txs so far)"
+                        )
+                        return txs
+                    data = await response.json()
+
+                txs.extend(data.get('txs', []))
+
+                next_key = (data.get('pagination') or {}).get('next_key')
+                if not next_key:
+                    return txs
+                params["pagination.key"] = next_key
         except Exception as e:
-            logger.warning(f"Error fetching txs for block {height}: {e}")
-            return []
+            logger.warning(f"Error fetching txs for block {height}: {e} ({len(txs)} txs so far)")
+            return txs
+
+        logger.warning(f"Stopped after {max_pages} pages of txs for block {height} ({len(txs)} txs)")
+        return txs
 
     async def fetch_supply_at_time(self, timestamp: datetime, denom: str) -> Optional[int]:
         """
@@ -112,37 +231,7 @@ class LunaOnChainCollector:
 
         For now, we'll use known data points from public sources.
         """
-        # Known supply data points during crash (from Terra research)
-        # Source: https://terra.smartstake.io/history
-        known_supply = {
-            "uluna": {
-                "2022-05-07": 345_800_000,      # Pre-crash
-                "2022-05-08": 400_000_000,      # +15%
-                "2022-05-09": 1_200_000_000,    # +200% (hyperinflation begins)
-                "2022-05-10": 3_500_000_000,    # Death spiral
-                "2022-05-11": 6_500_000_000_000,  # 6.5 TRILLION (peak)
-                "2022-05-12": 6_900_000_000_000,  # Chain halted
-                "2022-05-13": 6_900_000_000_000,  # Post-halt (no minting)
-                "2022-05-14": 6_900_000_000_000,  # Post-halt
-            },
-            "uusd": {
-                "2022-05-07": 11_200_000_000,   # $11.2B UST in circulation
-                "2022-05-08": 10_500_000_000,   # Some burning
-                "2022-05-09": 9_800_000_000,    # Mass exit
-                "2022-05-10": 8_500_000_000,    # De-pegging
-                "2022-05-11": 6_000_000_000,    # Collapse
-                "2022-05-12": 4_500_000_000,    # Chain halted
-                "2022-05-13": 4_500_000_000,    # Post-halt
-                "2022-05-14": 4_500_000_000,    # Post-halt
-            }
-        }
-
-        date_str = timestamp.strftime("%Y-%m-%d")
-
-        if denom in known_supply and date_str in known_supply[denom]:
-            return known_supply[denom][date_str]
-
-        return None
+        return known_supply_at(timestamp, denom)
 
     async def estimate_mint_burn_events(self) -> List[RiskEvent]:
         """
@@ -156,7 +245,7 @@ class LunaOnChainCollector:
 
         logger.info("Estimating LUNA/UST mint/burn events from supply changes...")
 
-        # LUNA supply changes
+        # Supply changes per denom, from consecutive daily snapshots
         luna_dates = [
             datetime(2022, 5, 7, tzinfo=timezone.utc),
             datetime(2022, 5, 8, tzinfo=timezone.utc),
@@ -168,20 +257,24 @@ class LunaOnChainCollector:
             datetime(2022, 5, 14, tzinfo=timezone.utc),
         ]
 
-        for i in range(len(luna_dates) - 1):
-            date = luna_dates[i]
-            next_date = luna_dates[i + 1]
+        # ISO day keys, formatted once for both the lookups and the logs
+        day_keys = [date.date().isoformat() for date in luna_dates]
 
-            supply_today = await self.fetch_supply_at_time(date, "uluna")
-            supply_tomorrow = await self.fetch_supply_at_time(next_date, "uluna")
+        for coin, denom in (("LUNA", "uluna"), ("UST", "uusd")):
+            supplies = [KNOWN_SUPPLY[denom].get(day) for day in day_keys]
+
+            for date, day, supply_today, supply_tomorrow in zip(
+                luna_dates, day_keys, supplies, supplies[1:]
+            ):
+                if not (supply_today and supply_tomorrow):
+                    continue
 
-            if supply_today and supply_tomorrow:
                 # Net mint (positive) or burn (negative)
                 net_change = supply_tomorrow - supply_today
 
                 event = RiskEvent(
                     timestamp=date,
-                    coin="LUNA",
+                    coin=coin,
                     chain="terra_classic",
                     source="onchain_supply",
                     net_supply_change=net_change,
@@ -197,40 +290,7 @@ class LunaOnChainCollector:
                 events.append(event)
 
                 logger.info(
-                    f"{date.strftime('%Y-%m-%d')}: LUNA supply change = "
-                    f"{net_change:+,.0f} ({net_change/supply_today*100:+.1f}%)"
-                )
-
-        # UST supply changes
-        for i in range(len(luna_dates) - 1):
-            date = luna_dates[i]
-            next_date = luna_dates[i + 1]
-
-            supply_today = await self.fetch_supply_at_time(date, "uusd")
-            supply_tomorrow = await self.fetch_supply_at_time(next_date, "uusd")
-
-            if supply_today and supply_tomorrow:
-                net_change = supply_tomorrow - supply_today
-
-                event = RiskEvent(
-                    timestamp=date,
-                    coin="UST",
-                    chain="terra_classic",
-                    source="onchain_supply",
-                    net_supply_change=net_change,
-                    price=None,
-                    block_number=None,
-                    tx_hash=None,
-                    confirmation_count=None,
-                    finality_tier="tier3",
-                    event_version=1,
-                    invalidated=False
-                )
-
-                events.append(event)
-
-                logger.info(
-                    f"{date.strftime('%Y-%m-%d')}: UST supply change = "
+                    f"{day}: {coin} supply change = "
                     f"{net_change:+,.0f} ({net_change/supply_today*100:+.1f}%)"
                 )
 
@@ -275,9 +335,8 @@ class LunaOnChainCollector:
 
 async def demo_luna_onchain_collection():
     """Demo: Collect Luna crash on-chain data."""
-    collector = LunaOnChainCollector()
-
-    events = await collector.collect_all_onchain_data()
+    async with LunaOnChainCollector() as collector:
+        events = await collector.collect_all_onchain_data()
 
     # Print summary
     logger.info("\n" + "=" * 70)
@@ -20,6 +20,8 @@ from typing import List, Dict, Set
 # Configuration & Schema
 from src.common.config import config
 from src.common.schema import RiskEvent, WindowState
+from src.common.http_session import close_session
+from src.common.event_loop import event_loop_factory
 
 # Feature Modules
 from src.confidence.tcs_calculator import tcs_calculator
@@ -45,6 +47,16 @@ logging.basicConfig(
 )
 logger = logging.getLogger("PipelineDriver")
 
+# Shared grace period for block monitors to exit on shutdown
+MONITOR_STOP_TIMEOUT_SEC = 5.0
+
+# Block monitor implementation per supported chain
+MONITOR_CLASSES = {
+    "ethereum": EthereumBlockMonitor,
+    "arbitrum": ArbitrumBlockMonitor,
+    "solana": SolanaBlockMonitor
+}
+
 
 class RiskMonitoringPipeline:
     """
@@ -58,154 +70,197 @@ class RiskMonitoringPipeline:
         
         # Components
         self.window_manager = WindowManager(window_size_sec=config.WINDOW_CONFIG["window_size_sec"])
-        self.block_monitors = {}
+        self.monitor_tasks: List[asyncio.Task] = []
+
+        # Bounds in-flight source fetches across all pollers
+        self._fetch_sem = asyncio.Semaphore(
+            config.SOURCE_CONFIG.get("max_concurrent_fetches", 16)
+        )
+
+        # Pollers hand events to one consumer that processes them in batches
+        self._event_queue: asyncio.Queue = asyncio.Queue()
         
         # Initialize block monitors for requested chains
-        if "ethereum" in chains:
-            self.block_monitors["ethereum"] = EthereumBlockMonitor(
-                "ethereum", finality_registry.get_tracker("ethereum")
-            )
-        if "arbitrum" in chains:
-            self.block_monitors["arbitrum"] = ArbitrumBlockMonitor(
-                "arbitrum", finality_registry.get_tracker("arbitrum")
-            )
-        if "solana" in chains:
-            self.block_monitors["solana"] = SolanaBlockMonitor(
-                "solana", finality_registry.get_tracker("solana")
-            )
+        self.block_monitors = {
+            chain: MONITOR_CLASSES[chain](chain, finality_registry.get_tracker(chain))
+            for chain in chains
+            if chain in MONITOR_CLASSES
+        }
 
     async def start(self):
         """Start the pipeline and all sub-components."""
         self.is_running = True
         logger.info(f"🚀 Starting Risk Monitoring Pipeline for {self.coins} on {self.chains}")
 
-        # 1. Start Block Monitors (Background Tasks)
-        monitor_tasks = []
-        for chain, monitor in self.block_monitors.items():
-            monitor_tasks.append(asyncio.create_task(monitor.start_monitoring()))
-            
-        # 2. Start Data Collection Loops
-        collection_tasks = [
-            asyncio.create_task(self._run_price_collection()),
-            asyncio.create_task(self._run_liquidity_collection()),
-            asyncio.create_task(self._run_volatility_collection()),
-            asyncio.create_task(self._run_sentiment_collection())
-        ]
+        # All sub-components run in one task group: if any of them fails,
+        # the rest are cancelled instead of being left running unobserved
+        try:
+            async with asyncio.TaskGroup() as tg:
+                # 1. Start Block Monitors (Background Tasks)
+                self.monitor_tasks = [
+                    tg.create_task(monitor.start_monitoring())
+                    for monitor in self.block_monitors.values()
+                ]
 
-        # 3. Start Window State Machine
-        window_task = asyncio.create_task(self.window_manager.run_state_machine())
+                # 2. Start Data Collection Loops (one poller per source/coin/chain)
+                self._start_pollers(tg)
+                tg.create_task(self._run_volatility_collection())
+                tg.create_task(self._run_event_processing())
 
-        # 4. Start Cross-Chain Aggregation Loop
-        aggregation_task = asyncio.create_task(self._run_cross_chain_aggregation())
+                # 3. Start Window State Machine
+                tg.create_task(self.window_manager.run_state_machine())
 
-        # 5. Main Event Loop (Keep alive and monitor health)
-        try:
-            await asyncio.gather(
-                *monitor_tasks,
-                *collection_tasks,
-                window_task,
-                aggregation_task
-            )
+                # 4. Start Cross-Chain Aggregation Loop
+                tg.create_task(self._run_cross_chain_aggregation())
+
+                # 5. Main Event Loop: the group keeps the pipeline alive
+                # until every task exits or one fails
         except asyncio.CancelledError:
             logger.info("Pipeline tasks cancelled, shutting down...")
         except Exception as e:
             logger.critical(f"Critical pipeline failure: {e}", exc_info=True)
             self.stop()
+            await self.stop_monitors()
 
     def stop(self):
         """Signal pipeline to stop."""
         logger.info("Stopping pipeline...")
         self.is_running = False
-        
-        # Stop block monitors
-        for monitor in self.block_monitors.values():
-            asyncio.create_task(monitor.stop_monitoring())
 
-    async def _process_event(self, event: RiskEvent):
-        """Process a raw event through quality pipeline and into window manager."""
+    async def stop_monitors(self, timeout: float = MONITOR_STOP_TIMEOUT_SEC):
+        """
+        Stop all block monitors concurrently.
+
+        Monitors get one shared timeout to leave their poll loop; any
+        still running after it are cancelled, so shutdown takes at most
+        `timeout` rather than a timeout per chain.
+        """
+        await asyncio.gather(
+            *(monitor.stop_monitoring() for monitor in self.block_monitors.values())
+        )
+
+        if not self.monitor_tasks:
+            return
+
+        _, pending = await asyncio.wait(self.monitor_tasks, timeout=timeout)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    def _process_events(self, events: List[RiskEvent]):
+        """
+        Process a batch of raw events through quality pipeline and into window manager.
+
+        Events are handed over in batches so the quality pipeline and
+        block monitors run once per batch, not once per event.
+        """
         # 1. Validate & Deduplicate
-        # pipeline processing returns a list of approved events (usually 0 or 1)
-        processed_events = quality_pipeline.process_events([event])
+        processed_events = quality_pipeline.process_events(events)
         
         if not processed_events:
             return
 
         # 2. Add to Window Manager (Temporal Aggregation)
+        events_by_chain: Dict[str, List[RiskEvent]] = {}
         for valid_event in processed_events:
             self.window_manager.add_event(valid_event)
+            events_by_chain.setdefault(valid_event.chain, []).append(valid_event)
+
+        # 3. Register with Block Monitors (for Reorg Protection)
+        for chain, chain_events in events_by_chain.items():
+            if chain in self.block_monitors:
+                self.block_monitors[chain].register_events(chain_events)
 
-            # 3. Register with Block Monitor (for Reorg Protection)
-            if valid_event.chain in self.block_monitors:
-                self.block_monitors[valid_event.chain].register_event(valid_event)
+    def _start_pollers(self, tg: asyncio.TaskGroup):
+        """
+        Spawn one polling task per (source, coin, chain) in the task group.
+
+        Each pair keeps its own cadence, so a slow endpoint only delays
+        its own stream instead of the whole coins x chains sweep.
+        """
+        intervals = config.SOURCE_CONFIG
+        sources = [
+            ("Price", price_source.fetch_price, self.chains, intervals["price_interval_sec"]),
+            ("Liquidity", liquidity_source.fetch_liquidity, self.chains, intervals["liquidity_interval_sec"]),
+            # Sentiment is usually global, but can be chain-specific
+            ("Sentiment", sentiment_source.fetch_sentiment, ["ethereum"], intervals["sentiment_interval_sec"])
+        ]
+
+        for source_name, fetch, chains, interval_sec in sources:
+            logger.info(f"Starting {source_name} Collection")
+            for coin in self.coins:
+                for chain in chains:
+                    tg.create_task(
+                        self._poll_one(source_name, fetch, coin, chain, interval_sec)
+                    )
+
+    async def _poll_one(self, source_name: str, fetch, coin: str, chain: str, interval_sec: float):
+        """Poll one source for a single coin/chain pair."""
+        guarded = self._guarded
+        enqueue = self._event_queue.put_nowait
 
-    async def _run_price_collection(self):
-        """Poll price data sources."""
-        logger.info("Starting Price Collection")
         while self.is_running:
             try:
-                for coin in self.coins:
-                    # Fetch from all chains
-                    for chain in self.chains:
-                        event = await price_source.fetch_price(coin, chain)
-                        if event:
-                            await self._process_event(event)
+                event = await guarded(fetch(coin, chain))
+                if event:
+                    enqueue(event)
             except Exception as e:
-                logger.error(f"Price collection error: {e}")
-            
-            await asyncio.sleep(config.SOURCE_CONFIG["price_interval_sec"])
+                logger.error(f"{source_name} fetch error for {coin}/{chain}: {e}")
+
+            await asyncio.sleep(interval_sec)
 
-    async def _run_liquidity_collection(self):
-        """Poll liquidity data sources."""
-        logger.info("Starting Liquidity Collection")
+    async def _run_event_processing(self):
+        """Drain polled events and process everything queued as one batch."""
+        queue = self._event_queue
+        process_events = self._process_events
         while self.is_running:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
             try:
-                for coin in self.coins:
-                    # Fetch from all chains
-                    for chain in self.chains:
-                        event = await liquidity_source.fetch_liquidity(coin, chain)
-                        if event:
-                            await self._process_event(event)
+                process_events(batch)
             except Exception as e:
-                logger.error(f"Liquidity collection error: {e}")
-            
-            await asyncio.sleep(config.SOURCE_CONFIG["liquidity_interval_sec"])
+                logger.error(f"Event processing error ({len(batch)} events): {e}")
+
+    async def _guarded(self, fetch):
+        """Await a fetch while holding the fetch semaphore."""
+        async with self._fetch_sem:
+            return await fetch
 
     async def _run_volatility_collection(self):
         """Poll volatility data sources."""
         logger.info("Starting Volatility Collection")
+        interval_sec = config.SOURCE_CONFIG["volatility_interval_sec"]
+        calculate_volatility = volatility_source.calculate_volatility
+
         while self.is_running:
             try:
+                events = []
                 for coin in self.coins:
                     # Volatility is often calculated per chain or globally
                     # Here we calculate for primary chain (Ethereum) or all
                     for chain in self.chains:
-                        event = await volatility_source.calculate_volatility(coin, chain)
+                        event = calculate_volatility(coin, chain)
                         if event:
-                            await self._process_event(event)
-            except Exception as e:
-                logger.error(f"Volatility collection error: {e}")
-            
-            await asyncio.sleep(config.SOURCE_CONFIG["volatility_interval_sec"])
+                            events.append(event)
 
-    async def _run_sentiment_collection(self):
-        """Poll sentiment data sources."""
-        logger.info("Starting Sentiment Collection")
-        while self.is_running:
-            try:
-                for coin in self.coins:
-                    # Sentiment is usually global, but can be chain-specific
-                    event = await sentiment_source.fetch_sentiment(coin, "ethereum")
-                    if event:
-                        await self._process_event(event)
+                if events:
+                    self._process_events(events)
             except Exception as e:
-                logger.error(f"Sentiment collection error: {e}")
+                logger.error(f"Volatility collection error: {e}")
             
-            await asyncio.sleep(config.SOURCE_CONFIG["sentiment_interval_sec"])
+            await asyncio.sleep(interval_sec)
 
     async def _run_cross_chain_aggregation(self):
-        """Periodic cross-chain aggregation of finalized windows."""
+        """Cross-chain aggregation of finalized windows, run as windows finalize."""
         logger.info("Starting Cross-Chain Aggregation Loop")
+        finalized_event = self.window_manager.finalized_event
         while self.is_running:
+            # Sleep until the window manager finalizes a window
+            await finalized_event.wait()
+            finalized_event.clear()
+
             try:
                 # 1. Get finalized snapshots from Window Manager
                 snapshots = self.window_manager.get_finalized_snapshots()
@@ -227,8 +282,6 @@ class RiskMonitoringPipeline:
                 
             except Exception as e:
                 logger.error(f"Aggregation loop error: {e}")
-            
-            await asyncio.sleep(10)
 
 
 async def main():
@@ -236,49 +289,64 @@ async def main():
     parser.add_argument("--coins", type=str, default="USDC,USDT,DAI", help="Comma-separated list of coins")
     parser.add_argument("--chains", type=str, default="ethereum,arbitrum,solana", help="Comma-separated list of chains")
     parser.add_argument("--duration", type=int, default=0, help="Run duration in seconds (0 for infinite)")
+    parser.add_argument("--stop-after-reorgs", type=int, default=0, help="Stop once this many reorgs are detected (0 to disable)")
     
     args = parser.parse_args()
     
-    coins = [c.strip() for c in args.coins.split(",")]
-    chains = [c.strip() for c in args.chains.split(",")]
+    # Interned so every event shares one string object per coin/chain,
+    # letting key lookups and equality checks short-circuit on identity
+    coins = [sys.intern(c.strip()) for c in args.coins.split(",")]
+    chains = [sys.intern(c.strip()) for c in args.chains.split(",")]
     
     pipeline = RiskMonitoringPipeline(coins, chains)
-    
+
+    # Set by whichever comes first: a signal, the duration deadline, the
+    # reorg threshold, or the driver exiting on its own
+    done = asyncio.Event()
+
     # Handle signals
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, lambda: asyncio.create_task(shutdown(pipeline)))
-    
-    driver_task = asyncio.create_task(pipeline.start())
-    
+        loop.add_signal_handler(sig, done.set)
+
     if args.duration > 0:
         logger.info(f"Running for {args.duration} seconds...")
-        await asyncio.sleep(args.duration)
-        await shutdown(pipeline)
-    else:
-        try:
-            await driver_task
-        except asyncio.CancelledError:
-            pass
+        loop.call_later(args.duration, done.set)
+
+    if args.stop_after_reorgs > 0:
+        def _on_reorg(_monitor):
+            total = sum(m.reorgs_detected for m in pipeline.block_monitors.values())
+            if total >= args.stop_after_reorgs:
+                logger.info(f"Observed {total} reorgs, stopping")
+                done.set()
+
+        for monitor in pipeline.block_monitors.values():
+            monitor.on_reorg = _on_reorg
+
+    driver_task = asyncio.create_task(pipeline.start())
+    driver_task.add_done_callback(lambda _: done.set())
+
+    await done.wait()
+    await shutdown(pipeline)
 
 async def shutdown(pipeline):
     """Graceful shutdown sequence."""
     logger.info("🛑 Shutting down pipeline...")
     pipeline.stop()
-    
-    # Give tasks a moment to cancel
-    await asyncio.sleep(1)
+    await pipeline.stop_monitors()
     
     tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
     for task in tasks:
         task.cancel()
     
     await asyncio.gather(*tasks, return_exceptions=True)
+    await close_session()
+    await finality_registry.close()
     logger.info("Pipeline shutdown complete.")
     sys.exit(0)
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(), loop_factory=event_loop_factory())
     except KeyboardInterrupt:
         pass
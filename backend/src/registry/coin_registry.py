@@ -5,7 +5,7 @@ Provides centralized configuration and metadata for all monitored coins.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
@@ -63,6 +63,15 @@ class CoinRegistry:
         for coin_symbol in self.coins.keys():
             self.coin_status[coin_symbol] = CoinStatus(coin=coin_symbol)
 
+        # Inverted index: chain -> coins deployed on it
+        self._coins_by_chain: Dict[str, List[str]] = {}
+        for coin_symbol, coin_config in self.coins.items():
+            self._index_coin_chains(coin_symbol, coin_config.chains)
+
+        # Memoized coin lists for the status queries, keyed by
+        # (query, threshold); cleared whenever a status changes
+        self._status_query_cache: Dict[Tuple[str, Optional[float]], List[str]] = {}
+
         logger.info(f"Initialized coin registry with {len(self.coins)} stablecoins")
 
     def get_coin_config(self, coin: str) -> Optional[CoinConfig]:
@@ -91,6 +100,7 @@ class CoinRegistry:
 
         # Recalculate health score
         status.health_score = self._calculate_health_score(status)
+        self._status_query_cache.clear()
 
     def _calculate_health_score(self, status: CoinStatus) -> float:
         """
@@ -102,6 +112,13 @@ class CoinRegistry:
         - Data freshness
         - TCS confidence
         """
+        # Fast path: no risk flags set (the steady state)
+        if not (status.is_depegged or status.has_liquidity_crisis or status.has_supply_anomaly):
+            score = status.temporal_confidence
+            if status.sentiment_score is not None and status.sentiment_score < -0.5:
+                score *= 0.9
+            return max(0.0, min(1.0, score))
+
         score = 1.0
 
         # Price stability (most critical)
@@ -135,40 +152,41 @@ class CoinRegistry:
         """Get list of all monitored coins."""
         return list(self.coins.keys())
 
+    def _query_coins(self, query: str, threshold: Optional[float], predicate) -> List[str]:
+        """Coins whose status matches predicate, scanned once per status change."""
+        key = (query, threshold)
+        coins = self._status_query_cache.get(key)
+        if coins is None:
+            coins = self._status_query_cache[key] = [
+                coin for coin, status in self.coin_status.items()
+                if predicate(status)
+            ]
+        return list(coins)
+
     def get_active_coins(self) -> List[str]:
         """Get list of actively monitored coins."""
-        return [
-            coin for coin, status in self.coin_status.items()
-            if status.is_active
-        ]
+        return self._query_coins("active", None, lambda s: s.is_active)
 
     def get_depegged_coins(self) -> List[str]:
         """Get list of currently depegged coins."""
-        return [
-            coin for coin, status in self.coin_status.items()
-            if status.is_depegged
-        ]
+        return self._query_coins("depegged", None, lambda s: s.is_depegged)
 
     def get_healthy_coins(self, threshold: float = 0.8) -> List[str]:
         """Get list of healthy coins (health_score >= threshold)."""
-        return [
-            coin for coin, status in self.coin_status.items()
-            if status.health_score >= threshold
-        ]
+        return self._query_coins("healthy", threshold, lambda s: s.health_score >= threshold)
 
     def get_at_risk_coins(self, threshold: float = 0.5) -> List[str]:
         """Get list of at-risk coins (health_score < threshold)."""
-        return [
-            coin for coin, status in self.coin_status.items()
-            if status.health_score < threshold
-        ]
+        return self._query_coins("at_risk", threshold, lambda s: s.health_score < threshold)
+
+    def _index_coin_chains(self, coin: str, chains: List[str]):
+        """Add a coin to the chain -> coins index."""
+        for chain in chains:
+            self._coins_by_chain.setdefault(chain, []).append(coin)
 
     def get_coins_by_chain(self, chain: str) -> List[str]:
         """Get list of coins available on a specific chain."""
-        return [
-            coin for coin, config in self.coins.items()
-            if chain in config.chains
-        ]
+        return list(self._coins_by_chain.get(chain, ()))
 
     def get_chains_for_coin(self, coin: str) -> List[str]:
         """Get list of chains where a coin is deployed."""
@@ -210,8 +228,16 @@ class CoinRegistry:
             **kwargs
         )
 
+        # Re-registering replaces the coin's previous chain entries
+        previous = self.coins.get(symbol)
+        if previous is not None:
+            for chain in previous.chains:
+                self._coins_by_chain[chain].remove(symbol)
+
         self.coins[symbol] = coin_config
+        self._index_coin_chains(symbol, chains)
         self.coin_status[symbol] = CoinStatus(coin=symbol)
+        self._status_query_cache.clear()
 
         logger.info(f"Registered new coin: {symbol} ({name}) on {len(chains)} chains")
 
@@ -219,12 +245,14 @@ class CoinRegistry:
         """Deactivate monitoring for a coin."""
         if coin in self.coin_status:
             self.coin_status[coin].is_active = False
+            self._status_query_cache.clear()
             logger.info(f"Deactivated coin: {coin}")
 
     def activate_coin(self, coin: str):
         """Activate monitoring for a coin."""
         if coin in self.coin_status:
             self.coin_status[coin].is_active = True
+            self._status_query_cache.clear()
             logger.info(f"Activated coin: {coin}")
 
     def get_registry_summary(self) -> Dict:
@@ -233,13 +261,16 @@ class CoinRegistry:
         depegged_coins = self.get_depegged_coins()
         at_risk_coins = self.get_at_risk_coins()
 
-        # Average health score
-        health_scores = [s.health_score for s in self.coin_status.values()]
-        avg_health = sum(health_scores) / len(health_scores) if health_scores else 0.0
+        # Average health score and TCS, in one pass over the statuses
+        total_health = 0.0
+        total_tcs = 0.0
+        for status in self.coin_status.values():
+            total_health += status.health_score
+            total_tcs += status.temporal_confidence
 
-        # Average TCS
-        tcs_scores = [s.temporal_confidence for s in self.coin_status.values()]
-        avg_tcs = sum(tcs_scores) / len(tcs_scores) if tcs_scores else 0.0
+        num_statuses = len(self.coin_status)
+        avg_health = total_health / num_statuses if num_statuses else 0.0
+        avg_tcs = total_tcs / num_statuses if num_statuses else 0.0
 
         return {
             "total_coins": len(self.coins),
@@ -248,10 +279,9 @@ class CoinRegistry:
             "at_risk_coins": len(at_risk_coins),
             "average_health_score": avg_health,
             "average_tcs": avg_tcs,
-            "chains_supported": list(set(
-                chain for coin in self.coins.values()
-                for chain in coin.chains
-            ))
+            "chains_supported": [
+                chain for chain, coins in self._coins_by_chain.items() if coins
+            ]
         }
 
 
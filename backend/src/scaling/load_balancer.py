@@ -8,10 +8,11 @@ Implements:
 - Health checking
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 from datetime import datetime
 import hashlib
+import heapq
 import logging
 
 from src.common.schema import RiskEvent
@@ -35,6 +36,9 @@ class LoadBalancer:
         # Track load per shard (for least-loaded strategy)
         self.shard_load: Dict[str, int] = defaultdict(int)
 
+        # Consistent-hash shard index per (coin, chain, replica count)
+        self._hash_cache: Dict[Tuple[str, str, int], int] = {}
+
     def distribute_events_round_robin(
         self,
         events: List[RiskEvent],
@@ -59,17 +63,17 @@ class LoadBalancer:
 
         shard_type = shards[0].shard_type
         current_idx = self.round_robin_index[shard_type]
+        num_shards = len(shards)
 
-        for event in events:
-            # Assign to next shard in round-robin
-            shard = shards[current_idx % len(shards)]
-            distribution[shard.shard_id].append(event)
-
-            # Move to next shard
-            current_idx += 1
+        # Event i goes to shards[(current_idx + i) % n], so each shard's
+        # events are one stride-n slice of the batch
+        for position, shard in enumerate(shards):
+            distribution[shard.shard_id].extend(
+                events[(position - current_idx) % num_shards::num_shards]
+            )
 
         # Update index for next call
-        self.round_robin_index[shard_type] = current_idx
+        self.round_robin_index[shard_type] = current_idx + len(events)
 
         logger.debug(
             f"Round-robin distribution for {shard_type.value}: "
@@ -100,18 +104,20 @@ class LoadBalancer:
             shard.shard_id: [] for shard in shards
         }
 
-        for event in events:
-            # Find least-loaded shard
-            least_loaded = min(
-                shards,
-                key=lambda s: self.shard_load[f"{s.shard_type.value}[{s.shard_id}]"]
-            )
+        # A (load, index) heap finds the least-loaded shard (ties go to
+        # the earlier shard, as with min())
+        shard_keys = [shard.key for shard in shards]
+        heap = [(self.shard_load[key], idx) for idx, key in enumerate(shard_keys)]
+        heapq.heapify(heap)
 
-            distribution[least_loaded.shard_id].append(event)
+        for event in events:
+            load, idx = heap[0]
+            distribution[shards[idx].shard_id].append(event)
+            heapq.heapreplace(heap, (load + 1, idx))
 
-            # Update load
-            shard_key = f"{least_loaded.shard_type.value}[{least_loaded.shard_id}]"
-            self.shard_load[shard_key] += 1
+        # Write the updated loads back
+        for load, idx in heap:
+            self.shard_load[shard_keys[idx]] = load
 
         return distribution
 
@@ -140,11 +146,19 @@ class LoadBalancer:
             shard.shard_id: [] for shard in shards
         }
 
+        num_shards = len(shards)
+        hash_cache = self._hash_cache
+
         for event in events:
-            # Hash coin+chain to get consistent shard assignment
-            key = f"{event.coin}:{event.chain}"
-            hash_value = int(hashlib.md5(key.encode()).hexdigest(), 16)
-            shard_idx = hash_value % len(shards)
+            # Hash coin+chain to get consistent shard assignment; the
+            # index only depends on the key and replica count, so it is
+            # computed once per pair
+            cache_key = (event.coin, event.chain, num_shards)
+            shard_idx = hash_cache.get(cache_key)
+            if shard_idx is None:
+                key = f"{event.coin}:{event.chain}"
+                hash_value = int.from_bytes(hashlib.md5(key.encode()).digest(), "big")
+                shard_idx = hash_cache[cache_key] = hash_value % num_shards
 
             shard = shards[shard_idx]
             distribution[shard.shard_id].append(event)
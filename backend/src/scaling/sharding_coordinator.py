@@ -13,17 +13,26 @@ are aggregated by the coordinator.
 """
 
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 import asyncio
+import itertools
 import logging
+import time
 
 from src.common.schema import RiskEvent, AggregatedRiskSnapshot
 from src.confidence.tcs_calculator import tcs_calculator
 
 logger = logging.getLogger(__name__)
 
+# Simulated per-batch shard latency for demos (0 disables it)
+SIMULATE_LATENCY_MS = 0
+
+# Smoothing factor for the per-batch throughput/latency moving averages
+STATS_EWMA_ALPHA = 0.1
+
 
 class ShardType(Enum):
     """Types of feature-based shards."""
@@ -36,7 +45,7 @@ class ShardType(Enum):
 
 @dataclass
 class ShardStats:
-    """Statistics for a shard."""
+    """Statistics for a shard (rates and latency are per-batch EWMAs)."""
     shard_type: ShardType
     events_processed: int = 0
     events_per_second: float = 0.0
@@ -57,12 +66,18 @@ class Shard:
         self.shard_id = shard_id
         self.stats = ShardStats(shard_type=shard_type)
 
-        logger.info(f"Initialized shard: {shard_type.value}[{shard_id}]")
+        # Stable label used for stats, load tracking and logs
+        self.key = f"{shard_type.value}[{shard_id}]"
+
+        logger.info(f"Initialized shard: {self.key}")
 
     async def process_events(self, events: List[RiskEvent]) -> List[RiskEvent]:
         """
         Process events for this shard.
 
+        Events arrive already routed to this shard's feature type by the
+        coordinator.
+
         In production, this would:
         - Run on separate worker processes
         - Have its own connection pools
@@ -74,49 +89,43 @@ class Shard:
         if not events:
             return []
 
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
-        # Simulate processing delay (would be actual computation in production)
-        await asyncio.sleep(0.01 * len(events))  # 10ms per event
+        # Optional fixed delay standing in for remote shard latency
+        if SIMULATE_LATENCY_MS:
+            await asyncio.sleep(SIMULATE_LATENCY_MS / 1000)
 
-        # Filter events for this shard's feature type
-        relevant_events = self._filter_events(events)
-
-        # Process TCS for each event
-        for event in relevant_events:
-            tcs_calculator.update_event_tcs(event)
+        # Process TCS for all events in one batch
+        tcs_calculator.update_event_tcs_batch(events)
 
         # Update stats
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
-        self.stats.events_processed += len(relevant_events)
-        self.stats.avg_processing_time_ms = processing_time * 1000 / len(relevant_events) if relevant_events else 0
-        self.stats.last_processed = datetime.utcnow()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        self._record_batch(len(events), processing_time)
 
-        if relevant_events:
-            logger.debug(
-                f"Shard {self.shard_type.value}[{self.shard_id}] processed "
-                f"{len(relevant_events)} events in {processing_time*1000:.1f}ms"
-            )
+        logger.debug(
+            "Shard %s processed %d events in %.1fms",
+            self.key, len(events), processing_time * 1000
+        )
 
-        return relevant_events
+        return events
 
-    def _filter_events(self, events: List[RiskEvent]) -> List[RiskEvent]:
-        """Filter events relevant to this shard's feature type."""
-        filtered = []
+    def _record_batch(self, num_events: int, processing_time: float):
+        """Fold one batch into the shard's running stats."""
+        stats = self.stats
+        per_event_ms = processing_time * 1000 / num_events
+        rate = num_events / processing_time if processing_time > 0 else None
 
-        for event in events:
-            if self.shard_type == ShardType.PRICE and event.price is not None:
-                filtered.append(event)
-            elif self.shard_type == ShardType.LIQUIDITY and event.liquidity_depth is not None:
-                filtered.append(event)
-            elif self.shard_type == ShardType.SUPPLY and event.net_supply_change is not None:
-                filtered.append(event)
-            elif self.shard_type == ShardType.VOLATILITY and event.market_volatility is not None:
-                filtered.append(event)
-            elif self.shard_type == ShardType.SENTIMENT and event.sentiment_score is not None:
-                filtered.append(event)
+        if stats.events_processed == 0:
+            # First batch seeds the averages
+            stats.avg_processing_time_ms = per_event_ms
+            stats.events_per_second = rate or 0.0
+        else:
+            stats.avg_processing_time_ms += STATS_EWMA_ALPHA * (per_event_ms - stats.avg_processing_time_ms)
+            if rate is not None:
+                stats.events_per_second += STATS_EWMA_ALPHA * (rate - stats.events_per_second)
 
-        return filtered
+        stats.events_processed += num_events
+        stats.last_processed = datetime.utcnow()
 
 
 class ShardCoordinator:
@@ -156,6 +165,10 @@ class ShardCoordinator:
             for shard in shard_list
         ]
 
+        # Splits each feature bucket across that type's replicas by
+        # coin/chain; created on first multi-replica batch
+        self._load_balancer = None
+
         logger.info(
             f"ShardCoordinator initialized with {len(self.all_shards)} shards "
             f"({len(ShardType)} types × {num_replicas_per_shard} replicas)"
@@ -179,35 +192,90 @@ class ShardCoordinator:
         if not events:
             return []
 
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
 
         logger.info(f"Distributing {len(events)} events across {len(self.all_shards)} shards")
 
-        # Process events in parallel across all shards
-        # Each shard will filter for its relevant events
+        # Route each feature bucket across the replicas of its shard type
+        # and process the non-empty slices in parallel
         tasks = [
-            shard.process_events(events)
-            for shard in self.all_shards
+            shard.process_events(shard_events)
+            for shard_type, bucket in self._partition(events).items()
+            if bucket
+            for shard, shard_events in self._split_across_replicas(shard_type, bucket)
+            if shard_events
         ]
 
         # Wait for all shards to complete (parallel processing!)
         shard_results = await asyncio.gather(*tasks)
 
         # Flatten results
-        all_processed = []
-        for result in shard_results:
-            all_processed.extend(result)
+        all_processed = list(itertools.chain.from_iterable(shard_results))
 
-        processing_time = (datetime.utcnow() - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
+        # Without simulated latency a small batch can finish within the
+        # clock's resolution
+        events_per_sec = len(all_processed) / processing_time if processing_time > 0 else 0.0
 
         logger.info(
             f"Distributed processing complete: {len(all_processed)} events "
             f"in {processing_time*1000:.1f}ms "
-            f"({len(all_processed)/processing_time:.0f} events/sec)"
+            f"({events_per_sec:.0f} events/sec)"
         )
 
         return all_processed
 
+    def _partition(self, events: List[RiskEvent]) -> Dict[ShardType, List[RiskEvent]]:
+        """
+        Bucket events by feature type in a single pass.
+
+        An event carrying several features lands in each of their buckets.
+        """
+        price, liquidity, supply, volatility, sentiment = [], [], [], [], []
+
+        for event in events:
+            if event.price is not None:
+                price.append(event)
+            if event.liquidity_depth is not None:
+                liquidity.append(event)
+            if event.net_supply_change is not None:
+                supply.append(event)
+            if event.market_volatility is not None:
+                volatility.append(event)
+            if event.sentiment_score is not None:
+                sentiment.append(event)
+
+        return {
+            ShardType.PRICE: price,
+            ShardType.LIQUIDITY: liquidity,
+            ShardType.SUPPLY: supply,
+            ShardType.VOLATILITY: volatility,
+            ShardType.SENTIMENT: sentiment
+        }
+
+    def _split_across_replicas(
+        self,
+        shard_type: ShardType,
+        events: List[RiskEvent]
+    ) -> List[Tuple[Shard, List[RiskEvent]]]:
+        """
+        Pair each replica of a shard type with its share of the events.
+
+        Consistent hashing on coin+chain keeps each stream on the same
+        replica, so replicas split the work instead of repeating it.
+        """
+        replicas = self.shards[shard_type]
+        if len(replicas) == 1:
+            return [(replicas[0], events)]
+
+        if self._load_balancer is None:
+            # Imported lazily: load_balancer imports this module
+            from src.scaling.load_balancer import LoadBalancer
+            self._load_balancer = LoadBalancer()
+
+        distribution = self._load_balancer.distribute_events_consistent_hash(events, replicas)
+        return [(replica, distribution[replica.shard_id]) for replica in replicas]
+
     async def aggregate_shard_results(
         self,
         window_id: str,
@@ -229,24 +297,19 @@ class ShardCoordinator:
 
     def get_shard_stats(self) -> Dict[str, ShardStats]:
         """Get statistics for all shards."""
-        return {
-            f"{shard.shard_type.value}[{shard.shard_id}]": shard.stats
-            for shard in self.all_shards
-        }
+        return {shard.key: shard.stats for shard in self.all_shards}
 
     def get_coordinator_stats(self) -> Dict:
         """Get overall coordinator statistics."""
-        total_events = sum(s.stats.events_processed for s in self.all_shards)
-        total_errors = sum(s.stats.errors for s in self.all_shards)
-
-        # Calculate events per shard type
-        events_by_type = {}
-        for shard_type in ShardType:
-            type_events = sum(
-                s.stats.events_processed
-                for s in self.shards[shard_type]
-            )
-            events_by_type[shard_type.value] = type_events
+        events_processed = attrgetter("stats.events_processed")
+
+        # Calculate events per shard type (and the total from those)
+        events_by_type = {
+            shard_type.value: sum(map(events_processed, shards))
+            for shard_type, shards in self.shards.items()
+        }
+        total_events = sum(events_by_type.values())
+        total_errors = sum(map(attrgetter("stats.errors"), self.all_shards))
 
         return {
             "total_shards": len(self.all_shards),
@@ -39,12 +39,11 @@ async def test_cryptocompare():
                     print(f"\nFirst candle: {candles[0]}")
                     print(f"Last candle: {candles[-1]}")
                     
-                    # Count non-zero prices
-                    non_zero = sum(1 for c in candles if c['close'] > 0)
-                    print(f"\nNon-zero prices: {non_zero}/{len(candles)}")
+                    # Candles with a price (one pass serves the count and the sample)
+                    with_prices = [c for c in candles if c['close'] > 0]
+                    print(f"\nNon-zero prices: {len(with_prices)}/{len(candles)}")
                     
                     # Show some with prices
-                    with_prices = [c for c in candles if c['close'] > 0]
                     if with_prices:
                         print(f"\nSample with prices:")
                         for c in with_prices[:3]: